@@ -0,0 +1,91 @@
+""" Benchmark of transliteration engines.
+
+Usage:
+    python -m task_0.benchmark
+"""
+from time import perf_counter as pc
+
+from .problem_0 import (
+    ENG_TO_RUS, RUS_TO_ENG, HybridTransliterator, Transliterator,
+    transliterate_by_slices, transliterate_many, transliteration,
+)
+
+TEXT = 'Съешь же ещё этих мягких французских булок, да выпей чаю. ' * 2000
+NAMES = ['Иванов', 'Щукин', 'Жёлудев', 'Артикул-1234', 'Ёлкин'] * 100000
+
+
+def measure(func, *args, repeat=5):
+    """ Return the best time of `repeat` calls func(*args) """
+    times = []
+    for _ in range(repeat):
+        t = pc()
+        func(*args)
+        times.append(pc() - t)
+    return min(times)
+
+
+def bench_engines():
+    """ Compare reference transliteration with transliterator classes """
+    texts = {'rus2eng': TEXT, 'eng2rus': transliteration(TEXT)}
+    dictions = {'rus2eng': RUS_TO_ENG, 'eng2rus': ENG_TO_RUS}
+
+    for direction, text in texts.items():
+        old = measure(transliterate_by_slices, text, dictions[direction])
+        print(f'{direction}: {len(text)} chars. '
+              f'transliterate_by_slices: {old:.4f} s')
+
+        for engine_class in (Transliterator, HybridTransliterator):
+            engine = engine_class(dictions[direction])
+            new = measure(engine.transliterate, text)
+            print(f'{direction}: {len(text)} chars. '
+                  f'{engine_class.__name__}: {new:.4f} s, '
+                  f'speedup: {old / new:.1f}x')
+
+
+def bench_calls():
+    """ Measure per-call cost of transliteration on short strings """
+    def by_slices():
+        for name in names:
+            transliterate_by_slices(name, RUS_TO_ENG)
+
+    def by_function():
+        for name in names:
+            transliteration(name)
+
+    names = NAMES[:100000]
+    old = measure(by_slices)
+    new = measure(by_function)
+    print(f'{len(names)} calls. transliterate_by_slices: {old:.4f} s, '
+          f'transliteration: {new:.4f} s, speedup: {old / new:.1f}x')
+
+
+def bench_words_cache():
+    """ Compare transliteration with and without words cache """
+    text = ' '.join(NAMES[:100000])
+    for direction, string in (('rus2eng', text),
+                              ('eng2rus', transliteration(text))):
+        old = measure(transliteration, string, direction)
+        new = measure(transliteration, string, direction, True)
+        print(f'{direction}: {len(string)} chars of names. '
+              f'transliteration: {old:.4f} s, with cache: {new:.4f} s, '
+              f'speedup: {old / new:.1f}x')
+
+
+def bench_many():
+    """ Measure throughput of transliterate_many for different workers """
+    for workers in (1, 2, 4, 8):
+        time = measure(transliterate_many, NAMES, 'rus2eng', workers,
+                       repeat=1)
+        print(f'transliterate_many: workers = {workers}. '
+              f'{len(NAMES)} strings, {len(NAMES) / time:,.0f} strings/s')
+
+
+def main():
+    bench_engines()
+    bench_calls()
+    bench_words_cache()
+    bench_many()
+
+
+if __name__ == '__main__':
+    main()
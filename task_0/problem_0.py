@@ -1,3 +1,8 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain, islice
+
 RUS_TO_ENG = {
     'а': 'a',
     'б': 'b',
@@ -34,6 +39,22 @@ RUS_TO_ENG = {
     'щ': 'shh',
 }
 ENG_TO_RUS = dict(map(reversed, RUS_TO_ENG.items()))
+# registered schemes of transliteration
+DIRECTIONS = {'rus2eng': RUS_TO_ENG, 'eng2rus': ENG_TO_RUS}
+# count of compiled schemes, which are kept in memory
+SCHEMES_CACHE_SIZE = 16
+# count of words in cache of every compiled scheme
+WORD_CACHE_SIZE = 4096
+# words and runs of non-word symbols between them
+WORDS = re.compile(r'\w+|\W+')
+
+# count of symbols to read from file at once
+CHUNK_SIZE = 64 * 1024
+# count of strings, which are sent to worker process at once
+BATCH_SIZE = 10000
+
+# kinds of characters, used to emulate str.istitle() char by char
+UNCASED, UPPER, LOWER = range(3)
 
 
 def get_replace(diction, substring):
@@ -43,22 +64,55 @@ def get_replace(diction, substring):
     return replace
 
 
-def transliteration(string, direction='rus2eng'):
+def transliteration(string, direction='rus2eng', cache=False):
     """ Function to transliterate string.
 
     Args:
         string(str): string to transliterate.
-        direction(str): direction of transliterate. "eng2rus" or "rus2eng"
+        direction(str): direction of transliterate, name of registered
+            scheme. "eng2rus" or "rus2eng" by default.
+        cache(bool): if True, string is transliterated word by word and
+            words are cached. Use it for texts with many repeated words,
+            statistics are returned by `cache_info(direction)`.
 
     Returns:
         str: translited string
 
     """
-    directions = {'rus2eng': RUS_TO_ENG, 'eng2rus': ENG_TO_RUS}
-    diction = directions.get(direction, None)
-    if not diction:
-        raise ValueError(f'Direction "{direction}" is not supported')
+    transliterator = get_transliterator(direction)
+    if cache:
+        return transliterator.transliterate_words(string)
+    return transliterator.transliterate(string)
+
+
+def cache_info(direction='rus2eng'):
+    """ Return statistics of words cache for direction.
+
+    Args:
+        direction(str): direction of transliterate, name of registered
+            scheme. "eng2rus" or "rus2eng" by default.
+
+    Returns:
+        CacheInfo: named tuple (hits, misses, maxsize, currsize)
+
+    """
+    return get_transliterator(direction).cache_info()
+
+
+def transliterate_by_slices(string, diction):
+    """ Reference transliteration, which checks all substrings of string.
+
+    It is slow, but simple, so it is used to check and benchmark
+    transliterator classes.
+
+    Args:
+        string(str): string to transliterate.
+        diction(dict): dict with replaces.
+
+    Returns:
+        str: translited string
 
+    """
     # max replace length in diction
     max_replace_len = max(map(len, diction.keys()))
 
@@ -82,3 +136,466 @@ def transliteration(string, direction='rus2eng'):
             yield replace
 
     return ''.join(gen_output())
+
+
+class TrieNode:
+    """ Node of the prefix tree, built from keys of the transliteration dict.
+
+    Attributes:
+        children(dict): child nodes by next (lowercase) character.
+        replace(str): replace for the key, which ends in this node, or None.
+        title_replace(str): replace for the titled key.
+    """
+    __slots__ = ('children', 'replace', 'title_replace')
+
+    def __init__(self):
+        self.children = {}
+        self.replace = None
+        self.title_replace = None
+
+
+class Transliterator:
+    """ Precompiled transliterator.
+
+    Builds a prefix tree from the dict once and then walks the input string
+    in a single pass, choosing the longest key at every position. Gives the
+    same output as `transliteration` function.
+
+    Example:
+        >> rus2eng = Transliterator(RUS_TO_ENG)
+        >> rus2eng.transliterate('Привет')
+        'Privet'
+    """
+
+    def __init__(self, diction, word_cache_size=WORD_CACHE_SIZE):
+        """ Init function which build prefix tree from diction.
+
+        Args:
+            diction(dict): dict with replaces, keys must be lowercase.
+            word_cache_size(int): count of words in the LRU cache, which is
+                used by `transliterate_words`.
+
+        Returns:
+            NoneType: return nothing
+
+        """
+        self.root = TrieNode()
+        self.max_replace_len = 0
+        # cache of (lowercase, kind) for every seen character
+        self.chars = {}
+        self.transliterate_word = \
+            lru_cache(maxsize=word_cache_size)(self.transliterate)
+        # words can be transliterated separately only if there are no keys,
+        # which contain both word and non-word symbols
+        self.splittable = all(map(WORDS.fullmatch, diction))
+
+        for key, replace in diction.items():
+            # `get_replace` lowers substring, so uppercase keys never match
+            if not key or not replace or key != key.lower():
+                continue
+
+            node = self.root
+            for char in key:
+                node = node.children.setdefault(char, TrieNode())
+            node.replace = replace
+            node.title_replace = replace.title()
+            self.max_replace_len = max(self.max_replace_len, len(key))
+
+    def char_info(self, char):
+        """ Return lowercase and kind (UPPER, LOWER, UNCASED) of char """
+        info = self.chars.get(char)
+        if info is None:
+            if char.istitle():
+                kind = UPPER
+            elif char.islower():
+                kind = LOWER
+            else:
+                kind = UNCASED
+            info = self.chars[char] = (char.lower(), kind)
+        return info
+
+    def match(self, string, position):
+        """ Find the longest key in string, which starts from position.
+
+        Args:
+            string(str): string to search in.
+            position(int): start position of key.
+
+        Returns:
+            1) str: replace for found key or None
+            2) int: position after found key
+
+        """
+        node = self.root
+        replace, end = None, position
+
+        # state of str.istitle() for string[position:index]
+        is_title, is_cased, previous_is_cased = True, False, False
+
+        for index in range(position, len(string)):
+            lower, kind = self.chars.get(string[index]) or \
+                self.char_info(string[index])
+
+            for char in lower:
+                node = node.children.get(char)
+                if node is None:
+                    return replace, end
+
+            if kind == UPPER:
+                is_title = is_title and not previous_is_cased
+                is_cased = previous_is_cased = True
+            elif kind == LOWER:
+                is_title = is_title and previous_is_cased
+                is_cased = previous_is_cased = True
+            else:
+                previous_is_cased = False
+
+            if node.replace is not None:
+                title = is_title and is_cased
+                replace = node.title_replace if title else node.replace
+                end = index + 1
+
+            if not node.children:
+                break
+
+        return replace, end
+
+    def transliterate(self, string):
+        """ Transliterate string.
+
+        Args:
+            string(str): string to transliterate.
+
+        Returns:
+            str: translited string
+
+        """
+        return self.transliterate_part(string)[0]
+
+    def transliterate_words(self, string):
+        """ Transliterate string word by word using LRU cache of words.
+
+        It is faster than `transliterate` for texts with many repeated words.
+
+        Args:
+            string(str): string to transliterate.
+
+        Returns:
+            str: translited string
+
+        """
+        if not self.splittable:
+            return self.transliterate(string)
+        return ''.join(map(self.transliterate_word, WORDS.findall(string)))
+
+    def cache_info(self):
+        """ Return hits, misses, maxsize and currsize of the words cache """
+        return self.transliterate_word.cache_info()
+
+    def transliterate_part(self, string, final=True):
+        """ Transliterate beginning of string, which is a part of the stream.
+
+        If string is not final, keys at the end of string can be continued
+        in the next part, so the last (max_replace_len - 1) symbols may stay
+        untransliterated.
+
+        Args:
+            string(str): part of the stream to transliterate.
+            final(bool): True, if it is the last part of the stream.
+
+        Returns:
+            1) str: translited beginning of string
+            2) int: position of first untransliterated symbol
+
+        """
+        output = []
+        children, chars = self.root.children, self.chars
+        position, length = 0, len(string)
+        limit = length if final else length - self.max_replace_len + 1
+        while position < limit:
+            char = string[position]
+            lower, kind = chars.get(char) or self.char_info(char)
+
+            # fast path: a single character without longer keys
+            node = children.get(lower)
+            if node is None and len(lower) == 1:
+                output.append(char)
+                position += 1
+                continue
+            if node is not None and not node.children:
+                title = kind == UPPER
+                output.append(node.title_replace if title else node.replace)
+                position += 1
+                continue
+
+            replace, end = self.match(string, position)
+            if replace is None:
+                # if replace not found, set symbol without changes
+                replace, end = string[position], position + 1
+            output.append(replace)
+            position = end
+
+        return ''.join(output), position
+
+    def stream(self, chunks):
+        """ Transliterate stream of string chunks.
+
+        Keys, which straddle chunk boundaries, are transliterated correctly.
+        Only the last (max_replace_len - 1) symbols are kept between chunks.
+
+        Args:
+            chunks(Iterable[str]): chunks of text.
+
+        Yields:
+            str: translited chunks
+
+        """
+        tail = ''
+        for chunk in chunks:
+            tail += chunk
+            output, position = self.transliterate_part(tail, final=False)
+            tail = tail[position:]
+            if output:
+                yield output
+
+        output, _ = self.transliterate_part(tail)
+        if output:
+            yield output
+
+
+class TranslateTable(dict):
+    """ Table for str.translate, which lazily computes replaces of symbols.
+
+    Replace of every symbol is computed by `get_replace` on first access
+    and cached, so str.translate works at C speed for known symbols.
+    """
+    __slots__ = ('diction',)
+
+    def __init__(self, diction):
+        super().__init__()
+        self.diction = diction
+
+    def __missing__(self, code):
+        char = chr(code)
+        replace = self[code] = get_replace(self.diction, char) or char
+        return replace
+
+
+class HybridTransliterator(Transliterator):
+    """ Transliterator, which uses str.translate for one-symbol keys.
+
+    Keys with several symbols (for example 'zh', 'shh') are found by regular
+    expression, text between them is translated by the table. Gives the
+    same output as `Transliterator`.
+    """
+
+    def __init__(self, diction, word_cache_size=WORD_CACHE_SIZE):
+        super().__init__(diction, word_cache_size)
+
+        singles, multiples = {}, {}
+        for key, replace in diction.items():
+            if not key or not replace or key != key.lower():
+                continue
+            if len(key) == 1:
+                singles[key] = replace
+            else:
+                multiples[key] = (replace, replace.title())
+
+        self.table = TranslateTable(singles)
+        self.multiples = multiples
+
+        # longest keys must be checked first
+        keys = sorted(multiples, key=len, reverse=True)
+        self.tokens = re.compile('|'.join(map(re.escape, keys))) \
+            if keys else None
+
+    def transliterate_part(self, string, final=True):
+        lowered = string.lower()
+        if len(lowered) != len(string):
+            # some symbols are lowered to several symbols, so positions in
+            # lowered and in string are different
+            return super().transliterate_part(string, final)
+
+        length = len(string)
+        if self.tokens is None:
+            return string.translate(self.table), length
+
+        output = []
+        position = 0
+        limit = length if final else length - self.max_replace_len + 1
+        for match in self.tokens.finditer(lowered):
+            start, end = match.span()
+            if start >= limit:
+                break
+
+            if position < start:
+                output.append(string[position:start].translate(self.table))
+
+            replace, title_replace = self.multiples[match.group()]
+            title = string[start:end].istitle()
+            output.append(title_replace if title else replace)
+            position = end
+
+        if position < limit:
+            output.append(string[position:limit].translate(self.table))
+            position = limit
+
+        return ''.join(output), position
+
+
+def register_scheme(name, diction):
+    """ Register new scheme of transliteration (or replace existing one).
+
+    Example:
+        >> register_scheme('rus2gost', RUS_TO_GOST)
+        >> transliteration('Привет', 'rus2gost')
+
+    Args:
+        name(str): name of scheme, used as direction.
+        diction(dict): dict with replaces, keys must be lowercase.
+
+    Returns:
+        NoneType: return nothing
+
+    """
+    if not diction:
+        raise ValueError(f'Scheme "{name}" is empty')
+    DIRECTIONS[name] = dict(diction)
+    get_transliterator.cache_clear()
+
+
+def unregister_scheme(name):
+    """ Remove scheme of transliteration, registered with name """
+    if DIRECTIONS.pop(name, None) is None:
+        raise ValueError(f'Direction "{name}" is not supported')
+    get_transliterator.cache_clear()
+
+
+@lru_cache(maxsize=SCHEMES_CACHE_SIZE)
+def get_transliterator(direction):
+    """ Return compiled HybridTransliterator for direction.
+
+    Transliterators are compiled once and cached, the least recently used
+    ones are dropped when more than SCHEMES_CACHE_SIZE schemes are used.
+
+    Args:
+        direction(str): direction of transliterate, name of registered
+            scheme. "eng2rus" or "rus2eng" by default.
+
+    Returns:
+        HybridTransliterator: transliterator for direction
+
+    """
+    diction = DIRECTIONS.get(direction, None)
+    if not diction:
+        raise ValueError(f'Direction "{direction}" is not supported')
+    return HybridTransliterator(diction)
+
+
+def transliterate_stream(chunks, direction='rus2eng'):
+    """ Transliterate stream of string chunks.
+
+    Args:
+        chunks(Iterable[str]): chunks of text, e.g. lines of file.
+        direction(str): direction of transliterate. "eng2rus" or "rus2eng"
+
+    Yields:
+        str: translited chunks
+
+    """
+    return get_transliterator(direction).stream(chunks)
+
+
+def transliterate_file(src, dst, direction='rus2eng', chunk_size=CHUNK_SIZE):
+    """ Read text from file-like object src and write translited text to dst.
+
+    Memory usage is bounded by chunk_size and does not depend on file size.
+
+    Args:
+        src: readable file-like object in text mode.
+        dst: writable file-like object in text mode.
+        direction(str): direction of transliterate. "eng2rus" or "rus2eng"
+        chunk_size(int): count of symbols to read at once.
+
+    Returns:
+        NoneType: return nothing
+
+    """
+    chunks = iter(partial(src.read, chunk_size), '')
+    for output in transliterate_stream(chunks, direction):
+        dst.write(output)
+
+
+def split_batches(iterable, batch_size):
+    """ Split iterable to lists with batch_size items (last can be less) """
+    iterator = iter(iterable)
+    batch = list(islice(iterator, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, batch_size))
+
+
+# transliterator of worker process, is set by init_worker
+worker_transliterator = None
+
+
+def init_worker(diction):
+    """ Compile transliterator of scheme once in worker process.
+
+    Scheme is sent to worker instead of its name: schemes, registered in
+    parent process, don't exist in workers, which are spawned.
+
+    Args:
+        diction(dict): dict with replaces of scheme.
+
+    Returns:
+        NoneType: return nothing
+
+    """
+    global worker_transliterator
+    worker_transliterator = HybridTransliterator(diction)
+
+
+def transliterate_batch(strings):
+    """ Transliterate list of strings. Runs in worker processes.
+
+    Args:
+        strings(List[str]): strings to transliterate.
+
+    Returns:
+        List[str]: translited strings
+
+    """
+    return list(map(worker_transliterator.transliterate, strings))
+
+
+def transliterate_many(iterable, direction='rus2eng', workers=None,
+                       batch_size=BATCH_SIZE, mp_context=None):
+    """ Transliterate many strings using pool of processes.
+
+    Strings are split to batches, every batch is transliterated in one of
+    worker processes. Order of results is the same as order of strings.
+
+    Args:
+        iterable(Iterable[str]): strings to transliterate.
+        direction(str): direction of transliterate. "eng2rus" or "rus2eng"
+        workers(int): count of processes, by default count of CPUs. If 1,
+            strings are transliterated in current process.
+        batch_size(int): count of strings, which are sent to process at once.
+        mp_context(multiprocessing.context.BaseContext): context to start
+            processes, by default context of multiprocessing.
+
+    Returns:
+        List[str]: translited strings
+
+    """
+    transliterator = get_transliterator(direction)
+    if workers == 1:
+        return list(map(transliterator.transliterate, iterable))
+
+    batches = split_batches(iterable, batch_size)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                             initializer=init_worker,
+                             initargs=(DIRECTIONS[direction],)) as executor:
+        results = executor.map(transliterate_batch, batches)
+        return list(chain.from_iterable(results))
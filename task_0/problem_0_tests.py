@@ -1,6 +1,14 @@
+import io
+from contextlib import suppress
+from multiprocessing import get_context
 from unittest import TestCase
 
-from .problem_0 import transliteration
+from .problem_0 import (
+    ENG_TO_RUS, RUS_TO_ENG, HybridTransliterator, Transliterator, cache_info,
+    get_transliterator, register_scheme, transliterate_by_slices,
+    transliterate_file, transliterate_many, transliterate_stream,
+    transliteration, unregister_scheme,
+)
 
 
 class Problem0Tests(TestCase):
@@ -25,3 +33,183 @@ class Problem0Tests(TestCase):
     def test_undefined_direction(self):
         with self.assertRaises(ValueError):
             transliteration('test', 'rus2ara')
+
+
+class TransliteratorTests(TestCase):
+    def setUp(self):
+        self.rus2eng = Transliterator(RUS_TO_ENG)
+        self.eng2rus = Transliterator(ENG_TO_RUS)
+        self.inputs = [
+            '',
+            'Привет',
+            '!ЗдравсТвуй, Юзер!',
+            'не нее, льняной, тощий',
+            'ЩУКА Щука щука ЁЖ',
+            'SHH Shh sHH shh KH Kh jo JO',
+        ]
+
+    def test_same_as_slices(self):
+        for string in self.inputs:
+            self.assertEqual(
+                self.rus2eng.transliterate(string),
+                transliterate_by_slices(string, RUS_TO_ENG),
+            )
+            self.assertEqual(
+                self.eng2rus.transliterate(string),
+                transliterate_by_slices(string, ENG_TO_RUS),
+            )
+
+    def test_longest_match(self):
+        self.assertEqual(self.eng2rus.transliterate('shhsh'), 'щш')
+        self.assertEqual(self.eng2rus.transliterate('Sh1'), 'Ш1')
+        self.assertEqual(self.eng2rus.transliterate('s'), 'с')
+
+
+class HybridTransliteratorTests(TransliteratorTests):
+    def setUp(self):
+        super().setUp()
+        self.rus2eng = HybridTransliterator(RUS_TO_ENG)
+        self.eng2rus = HybridTransliterator(ENG_TO_RUS)
+
+    def test_title(self):
+        self.assertEqual(self.rus2eng.transliterate('ЁЖ Щ щ'), 'JoZh Shh shh')
+        self.assertEqual(self.eng2rus.transliterate('ZH Zh zH'), 'ж Ж ж')
+
+    def test_lowered_to_several_symbols(self):
+        # 'İ'.lower() has two symbols, so fallback to prefix tree is used
+        string = 'İ zhuk'
+        self.assertEqual(self.eng2rus.transliterate(string), 'İ жук')
+
+
+class StreamTests(TestCase):
+    def test_chunk_boundaries(self):
+        eng = 'Shhuka, ShHUKA, kharakter, jolka'
+        rus = transliteration(eng, 'eng2rus')
+        for size in range(1, 5):
+            chunks = [eng[i:i + size] for i in range(0, len(eng), size)]
+            output = ''.join(transliterate_stream(chunks, 'eng2rus'))
+            self.assertEqual(output, rus)
+
+    def test_empty(self):
+        self.assertEqual(list(transliterate_stream([])), [])
+        self.assertEqual(list(transliterate_stream(['', ''])), [])
+
+    def test_file(self):
+        rus = 'не нее, льняной, тощий\n' * 100
+        src, dst = io.StringIO(rus), io.StringIO()
+        transliterate_file(src, dst, chunk_size=7)
+        self.assertEqual(dst.getvalue(), transliteration(rus))
+
+        src, dst = io.StringIO(dst.getvalue()), io.StringIO()
+        transliterate_file(src, dst, 'eng2rus', chunk_size=2)
+        self.assertEqual(dst.getvalue(), rus)
+
+    def test_undefined_direction(self):
+        with self.assertRaises(ValueError):
+            transliterate_stream(['test'], 'rus2ara')
+
+
+class ManyTests(TestCase):
+    def setUp(self):
+        self.strings = ['Привет', 'Юзер', 'тощий', '', 'Щука'] * 7
+
+    def test_order(self):
+        out = [transliteration(string) for string in self.strings]
+        self.assertListEqual(
+            transliterate_many(self.strings, workers=2, batch_size=3),
+            out,
+        )
+        self.assertListEqual(
+            transliterate_many(iter(self.strings), workers=1),
+            out,
+        )
+
+    def test_eng2rus(self):
+        eng = transliterate_many(self.strings, workers=2, batch_size=4)
+        self.assertListEqual(
+            transliterate_many(eng, 'eng2rus', workers=2, batch_size=4),
+            self.strings,
+        )
+
+    def test_empty(self):
+        self.assertListEqual(transliterate_many([], workers=2), [])
+
+    def test_undefined_direction(self):
+        with self.assertRaises(ValueError):
+            transliterate_many(['test'], 'rus2ara')
+
+
+class SchemesTests(TestCase):
+    def setUp(self):
+        register_scheme('rus2test', {'щ': 'sch', 'ш': 'sh', 'х': 'h'})
+
+    def tearDown(self):
+        with suppress(ValueError):
+            unregister_scheme('rus2test')
+
+    def test_register(self):
+        self.assertEqual(transliteration('Щи, шах', 'rus2test'), 'Schи, shаh')
+
+    def test_many_spawn(self):
+        # spawned workers don't have schemes, registered in this process
+        strings = ['Щи', 'шах'] * 3
+        self.assertListEqual(
+            transliterate_many(strings, 'rus2test', workers=2, batch_size=2,
+                               mp_context=get_context('spawn')),
+            ['Schи', 'shаh'] * 3,
+        )
+
+    def test_cached(self):
+        self.assertIs(
+            get_transliterator('rus2test'),
+            get_transliterator('rus2test'),
+        )
+        self.assertIs(
+            get_transliterator('rus2eng'),
+            get_transliterator('rus2eng'),
+        )
+
+    def test_replace(self):
+        transliteration('щ', 'rus2test')
+        register_scheme('rus2test', {'щ': 'shch'})
+        self.assertEqual(transliteration('щ', 'rus2test'), 'shch')
+
+    def test_unregister(self):
+        unregister_scheme('rus2test')
+        with self.assertRaises(ValueError):
+            transliteration('щ', 'rus2test')
+        with self.assertRaises(ValueError):
+            unregister_scheme('rus2test')
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            register_scheme('empty', {})
+
+
+class WordsCacheTests(TestCase):
+    def test_same_output(self):
+        rus = '!ЗдравсТвуй, Юзер! не нее, льняной, тощий ' * 3
+        eng = transliteration(rus)
+        self.assertEqual(transliteration(rus, cache=True), eng)
+        self.assertEqual(transliteration(eng, 'eng2rus', cache=True), rus)
+
+    def test_hits(self):
+        transliterator = Transliterator(RUS_TO_ENG, word_cache_size=2)
+        transliterator.transliterate_words('щука щука')
+        info = transliterator.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)  # 'щука' and ' '
+        self.assertEqual(info.maxsize, 2)
+
+        transliterator.transliterate_words('ёж, ёж')
+        self.assertEqual(transliterator.cache_info().currsize, 2)
+
+    def test_cache_info(self):
+        before = cache_info().hits
+        transliteration('тест тест тест', cache=True)
+        self.assertGreater(cache_info().hits, before)
+
+    def test_not_splittable(self):
+        transliterator = Transliterator({'a-b': 'x'})
+        self.assertFalse(transliterator.splittable)
+        self.assertEqual(transliterator.transliterate_words('a-b-a'), 'x-a')
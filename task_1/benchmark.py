@@ -0,0 +1,74 @@
+""" Benchmark of parallel counting of key-value pairs.
+
+Usage:
+    python -m task_1.benchmark
+"""
+import tracemalloc
+from time import perf_counter as pc
+
+from .problem_1 import KeyValueCounter, count_parallel, sum_of_keys
+
+DICTS = [
+    {'id': i % 1000, 'user': i % 77, 'status': 'active', 'group': i % 5}
+    for i in range(1000000)
+]
+
+
+def measure(func, *args, repeat=3):
+    """ Return the best time of `repeat` calls func(*args) """
+    times = []
+    for _ in range(repeat):
+        t = pc()
+        func(*args)
+        times.append(pc() - t)
+    return min(times)
+
+
+def bench_parallel():
+    """ Compare serial counting with count_parallel for different workers """
+    serial = measure(KeyValueCounter, DICTS)
+    print(f'{len(DICTS)} dicts. serial: {serial:.4f} s')
+
+    for workers in (1, 2, 4, 8):
+        time = measure(count_parallel, DICTS, workers, repeat=1)
+        print(f'{len(DICTS)} dicts. count_parallel: workers = {workers}. '
+              f'{time:.4f} s, speedup: {serial / time:.2f}x')
+
+
+def measure_memory(func, *args):
+    """ Return time and peak memory (MB) of func(*args) """
+    tracemalloc.start()
+    t = pc()
+    func(*args)
+    time = pc() - t
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return time, peak
+
+
+def bench_output():
+    """ Compare output formats on many distinct pairs """
+    dicts = [{'id': i, 'user': i % 77} for i in range(1000000)]
+    counter = KeyValueCounter(dicts)
+
+    formats = {
+        'sum_of_keys': lambda: list(sum_of_keys(dicts)),
+        'dicts': lambda: list(counter),
+        'tuples': lambda: list(counter.tuples()),
+        'columns': counter.columns,
+        'top(10)': lambda: counter.top(10),
+        'filter(min_count=2)': lambda: list(counter.filter(2)),
+    }
+    for title, func in formats.items():
+        time, peak = measure_memory(func)
+        print(f'{len(counter)} pairs. {title}: {time:.4f} s, '
+              f'peak memory {peak:.1f} MB')
+
+
+def main():
+    bench_parallel()
+    bench_output()
+
+
+if __name__ == '__main__':
+    main()
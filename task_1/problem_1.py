@@ -1,12 +1,420 @@
-from collections import Counter
-from typing import List
+import heapq
+import math
+import os
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain, islice
+from operator import itemgetter, methodcaller
+from typing import Hashable, Iterable, Iterator, List, Tuple
 
+# count of dicts, which are sent to worker process at once
+BATCH_SIZE = 50000
 
-def sum_of_keys(list_of_dicts: List[dict]) -> List[dict]:
+# (key, value, count)
+Row = Tuple[Hashable, Hashable, int]
+
+
+class KeyValueCounter:
+    """ Counter of key-value pairs in dicts.
+
+    Dicts can be added by batches from stream. Counters, which are built
+    on different workers, can be merged.
+
+    Example:
+        >> counter = KeyValueCounter([{'id': 1}, {'id': 1, 'u': 2}])
+        >> counter.update([{'u': 2}])
+        >> list(counter)
+        [{'key': 'id', 'value': 1, 'count': 2},
+         {'key': 'u', 'value': 2, 'count': 2}]
+    """
+    __slots__ = ('counter',)
+
+    def __init__(self, list_of_dicts: Iterable[dict] = None):
+        self.counter = Counter()
+        if list_of_dicts:
+            self.update(list_of_dicts)
+
+    def update(self, list_of_dicts: Iterable[dict]) -> 'KeyValueCounter':
+        """ Count pairs from every dict of batch.
+
+        Args:
+            list_of_dicts(Iterable[dict]): batch of dicts
+
+        Returns:
+            KeyValueCounter: return self
+
+        """
+        items = map(methodcaller('items'), list_of_dicts)
+        return self.update_pairs(chain.from_iterable(items))
+
+    def update_pairs(self, pairs: Iterable[tuple]) -> 'KeyValueCounter':
+        """ Count (key, value) pairs.
+
+        Args:
+            pairs(Iterable[tuple]): pairs to count
+
+        Returns:
+            KeyValueCounter: return self
+
+        """
+        self.counter.update(pairs)
+        return self
+
+    def merge(self, other: 'KeyValueCounter') -> 'KeyValueCounter':
+        """ Add counts from other counter to self.
+
+        Args:
+            other(KeyValueCounter): counter to merge
+
+        Returns:
+            KeyValueCounter: return self
+
+        """
+        if not isinstance(other, KeyValueCounter):
+            raise TypeError('You can merge only KeyValueCounter')
+        self.counter.update(other.counter)
+        return self
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def __add__(self, other):
+        return KeyValueCounter().merge(self).merge(other)
+
+    def __len__(self):
+        return len(self.counter)
+
+    def __iter__(self):
+        for item, count in self.counter.items():
+            yield {'key': item[0], 'value': item[1], 'count': count}
+
+    def tuples(self) -> Iterator[Row]:
+        """ Iterate (key, value, count) tuples without creating dicts """
+        for (key, value), count in self.counter.items():
+            yield key, value, count
+
+    def columns(self) -> Tuple[tuple, tuple, tuple]:
+        """ Return counts as three parallel tuples.
+
+        Returns:
+            1) tuple: keys
+            2) tuple: values
+            3) tuple: counts
+
+        """
+        pairs = tuple(self.counter)
+        keys = tuple(map(itemgetter(0), pairs))
+        values = tuple(map(itemgetter(1), pairs))
+        return keys, values, tuple(self.counter.values())
+
+    def top(self, n: int) -> List[Row]:
+        """ Return n the most frequent pairs.
+
+        Args:
+            n(int): count of pairs
+
+        Returns:
+            List[Tuple]: list of (key, value, count) from the most frequent
+
+        """
+        return [
+            (key, value, count)
+            for (key, value), count in self.counter.most_common(n)
+        ]
+
+    def filter(self, min_count: int) -> Iterator[Row]:
+        """ Iterate (key, value, count) tuples with count >= min_count """
+        for (key, value), count in self.counter.items():
+            if count >= min_count:
+                yield key, value, count
+
+
+class SpaceSavingCounter:
+    """ Approximate counter of key-value pairs with bounded memory.
+
+    Uses Space-Saving algorithm: only `capacity` pairs are tracked, when new
+    pair comes and there is no free place, the least frequent pair is
+    replaced. Count of every pair is overestimated by no more than its
+    error, which is no more than total / capacity. Every pair, which occurs
+    more than total / capacity times, is tracked.
+
+    Example:
+        >> counter = SpaceSavingCounter.from_error(0.001)  # 1000 pairs
+        >> counter.update(stream_of_dicts)
+        >> list(counter)[:10]  # the most frequent pairs
+    """
+    __slots__ = ('capacity', 'total', 'counts', 'errors', 'heap', 'order')
+
+    def __init__(self, capacity: int, list_of_dicts: Iterable[dict] = None):
+        if capacity < 1:
+            raise ValueError('Capacity must be positive')
+
+        self.capacity = capacity
+        self.total = 0  # count of all pairs
+        self.counts = {}
+        self.errors = {}
+        # heap of (count, order, pair), one entry for every tracked pair
+        # with count <= real count of the pair
+        self.heap = []
+        self.order = 0  # to compare entries with equal counts
+
+        if list_of_dicts:
+            self.update(list_of_dicts)
+
+    @classmethod
+    def from_error(cls, error: float,
+                   list_of_dicts: Iterable[dict] = None):
+        """ Create counter, where counts are overestimated by no more than
+        error * total.
+
+        Args:
+            error(float): relative error, from 0 to 1
+            list_of_dicts(Iterable[dict]): dicts to count
+
+        Returns:
+            SpaceSavingCounter: new counter
+
+        """
+        if not 0 < error <= 1:
+            raise ValueError('Error must be in (0, 1]')
+        return cls(math.ceil(1 / error), list_of_dicts)
+
+    @property
+    def error_bound(self) -> float:
+        """ Max overestimation of counts """
+        return self.total / self.capacity
+
+    def pop_min(self):
+        """ Remove the least frequent pair and return its count """
+        heap, counts = self.heap, self.counts
+        while True:
+            min_count, _, item = heap[0]
+            current = counts[item]
+            if current == min_count:
+                break
+            # entry is outdated, update it and check again
+            self.order += 1
+            heapq.heapreplace(heap, (current, self.order, item))
+
+        del counts[item]
+        del self.errors[item]
+        heapq.heappop(heap)
+        return min_count
+
+    def update(self, list_of_dicts: Iterable[dict]) -> 'SpaceSavingCounter':
+        """ Count pairs from every dict of batch.
+
+        Args:
+            list_of_dicts(Iterable[dict]): batch of dicts
+
+        Returns:
+            SpaceSavingCounter: return self
+
+        """
+        items = map(methodcaller('items'), list_of_dicts)
+        return self.update_pairs(chain.from_iterable(items))
+
+    def update_pairs(self, pairs: Iterable[tuple]) -> 'SpaceSavingCounter':
+        """ Count (key, value) pairs.
+
+        Args:
+            pairs(Iterable[tuple]): pairs to count
+
+        Returns:
+            SpaceSavingCounter: return self
+
+        """
+        counts, errors, heap = self.counts, self.errors, self.heap
+
+        for item in pairs:
+            self.total += 1
+            current = counts.get(item)
+            if current is not None:
+                counts[item] = current + 1
+                continue
+
+            error = self.pop_min() if len(counts) >= self.capacity else 0
+            counts[item] = error + 1
+            errors[item] = error
+            self.order += 1
+            heapq.heappush(heap, (error + 1, self.order, item))
+
+        return self
+
+    def merge(self, other: 'SpaceSavingCounter') -> 'SpaceSavingCounter':
+        """ Add counts from other counter to self.
+
+        Errors of both counters are summed, capacity of self is kept.
+
+        Args:
+            other(SpaceSavingCounter): counter to merge
+
+        Returns:
+            SpaceSavingCounter: return self
+
+        """
+        if not isinstance(other, SpaceSavingCounter):
+            raise TypeError('You can merge only SpaceSavingCounter')
+
+        # pair, which is not tracked by a full counter, can have count up
+        # to the min count of this counter
+        min_self = self.min_count()
+        min_other = other.min_count()
+
+        counts, errors = {}, {}
+        for item in chain(self.counts, other.counts):
+            if item in counts:
+                continue
+            counts[item] = self.counts.get(item, min_self) + \
+                other.counts.get(item, min_other)
+            errors[item] = self.errors.get(item, min_self) + \
+                other.errors.get(item, min_other)
+
+        top = heapq.nlargest(self.capacity, counts, key=counts.get)
+        self.counts = {item: counts[item] for item in top}
+        self.errors = {item: errors[item] for item in top}
+        self.heap = [
+            (frequency, order, item)
+            for order, (item, frequency) in enumerate(self.counts.items())
+        ]
+        self.order = len(self.heap)
+        heapq.heapify(self.heap)
+        self.total += other.total
+        return self
+
+    def min_count(self) -> int:
+        """ Return max count of untracked pair """
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def __add__(self, other):
+        return SpaceSavingCounter(self.capacity).merge(self).merge(other)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __iter__(self):
+        """ Iterate pairs from the most frequent to the least frequent """
+        items = sorted(self.counts.items(), key=lambda x: x[1], reverse=True)
+        for item, frequency in items:
+            yield {'key': item[0], 'value': item[1], 'count': frequency}
+
+    def error(self, key, value) -> int:
+        """ Return max overestimation of count of pair (0 if untracked) """
+        return self.errors.get((key, value), 0)
+
+
+def split_batches(iterable: Iterable, batch_size: int) -> Iterator[list]:
+    """ Split iterable to lists with batch_size items (last can be less) """
+    iterator = iter(iterable)
+    batch = list(islice(iterator, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, batch_size))
+
+
+def encode_batch(batch: List[dict]) -> Tuple[tuple, array, list]:
+    """ Encode batch of dicts to columns, which are sent to worker.
+
+    Dicts of a stream usually have the same keys, so tuple of keys (shape)
+    is stored once, every dict is stored as index of its shape and its
+    values. Pickle of such batch is about 40% smaller than pickle of list
+    of dicts, and worker counts pairs from it without creating dicts.
+
+    Args:
+        batch(List[dict]): batch of dicts
+
+    Returns:
+        1) tuple: shapes, tuples of keys
+        2) array: index of shape of every dict
+        3) list: values of all dicts
+
+    """
+    shape_of = list(map(tuple, batch))
+    indexes = {shape: i for i, shape in enumerate(dict.fromkeys(shape_of))}
+    shape_ids = array('I', map(indexes.__getitem__, shape_of))
+    values = list(chain.from_iterable(map(methodcaller('values'), batch)))
+    return tuple(indexes), shape_ids, values
+
+
+def decode_pairs(shapes: tuple, shape_ids: array,
+                 values: list) -> Iterator[tuple]:
+    """ Iterate (key, value) pairs of batch, encoded by `encode_batch` """
+    keys = chain.from_iterable(map(shapes.__getitem__, shape_ids))
+    return zip(keys, values)
+
+
+def count_batch(counter_factory, encoded: tuple):
+    """ Count pairs in encoded batch of dicts. Runs in worker processes.
+
+    Args:
+        counter_factory(Callable): function to create empty counter
+        encoded(tuple): batch, encoded by `encode_batch`
+
+    Returns:
+        KeyValueCounter: counter of the batch
+
+    """
+    return counter_factory().update_pairs(decode_pairs(*encoded))
+
+
+def count_parallel(list_of_dicts: Iterable[dict], workers: int = None,
+                   batch_size: int = BATCH_SIZE,
+                   counter_factory=KeyValueCounter):
+    """ Count pairs in dicts using pool of processes.
+
+    Dicts are split to batches, every batch is encoded to compact columns
+    (see `encode_batch`) and counted in one of worker processes, then
+    counters are merged in order of batches. Only a few batches are
+    processed at the same time, so input can be a stream of any size.
+
+    Args:
+        list_of_dicts(Iterable[dict]): dicts to count
+        workers(int): count of processes, by default count of CPUs
+        batch_size(int): count of dicts, which are sent to process at once
+        counter_factory(Callable): function to create empty counter,
+            KeyValueCounter by default. It must be picklable.
+
+    Returns:
+        KeyValueCounter: counter of all dicts
+
+    """
+    workers = workers or os.cpu_count()
+    result = counter_factory()
+    count = partial(count_batch, counter_factory)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for batch in split_batches(list_of_dicts, batch_size):
+            pending.append(executor.submit(count, encode_batch(batch)))
+
+            # don't keep in memory more batches than workers can process
+            if len(pending) > 2 * workers:
+                result.merge(pending.popleft().result())
+
+        for future in pending:
+            result.merge(future.result())
+
+    return result
+
+
+def sum_of_keys(list_of_dicts: List[dict], workers: int = 1,
+                capacity: int = None) -> List[dict]:
     """ Function to calc and return count keys in dicts with equal values
 
     Args:
         list_of_dicts(List[dict]): list with some dicts
+        workers(int): count of processes, see `count_parallel`. If 1,
+            dicts are counted in current process.
+        capacity(int): if set, only the most frequent pairs are counted
+            approximately, see `SpaceSavingCounter`. Pairs are returned
+            from the most frequent to the least frequent.
 
     Returns:
         List[dict]: list with dicts, when each dict have this structure:
@@ -14,10 +422,13 @@ def sum_of_keys(list_of_dicts: List[dict]) -> List[dict]:
 
     """
 
-    counter = Counter()
-    # add to counter items from each dict
-    for one_dict in list_of_dicts:
-        counter.update(one_dict.items())
+    if capacity is None:
+        counter_factory = KeyValueCounter
+    else:
+        counter_factory = partial(SpaceSavingCounter, capacity)
 
-    for item, count in counter.items():
-        yield {'key': item[0], 'value': item[1], 'count': count}
+    if workers == 1:
+        yield from counter_factory().update(list_of_dicts)
+    else:
+        yield from count_parallel(list_of_dicts, workers,
+                                  counter_factory=counter_factory)
@@ -1,6 +1,10 @@
+import pickle
 from unittest import TestCase
 
-from .problem_1 import sum_of_keys
+from .problem_1 import (
+    KeyValueCounter, SpaceSavingCounter, count_parallel, decode_pairs,
+    encode_batch, sum_of_keys,
+)
 
 
 class Problem1Tests(TestCase):
@@ -31,3 +35,169 @@ class Problem1Tests(TestCase):
                {'key': 'u', 'value': 1, 'count': 2}]
 
         self.assertListEqual(list(sum_of_keys(inp)), out)
+
+
+class KeyValueCounterTests(TestCase):
+
+    def setUp(self):
+        self.inp = [{'id': 1, 'u': 1},
+                    {'id': 1, 'u': 2},
+                    {'id': 2, 'u': 2},
+                    {'id': 1}]
+
+    def test_batches(self):
+        counter = KeyValueCounter()
+        for i in range(0, len(self.inp), 3):
+            counter.update(self.inp[i:i + 3])
+
+        self.assertListEqual(list(counter), list(sum_of_keys(self.inp)))
+        self.assertEqual(len(counter), 4)
+
+    def test_merge(self):
+        c1 = KeyValueCounter(self.inp[:2])
+        c2 = KeyValueCounter(self.inp[2:])
+
+        self.assertListEqual(list(c1 + c2), list(sum_of_keys(self.inp)))
+        self.assertEqual(len(c1), 3)
+
+        c1 += c2
+        self.assertListEqual(list(c1), list(sum_of_keys(self.inp)))
+
+        with self.assertRaises(TypeError):
+            c1.merge(self.inp)
+
+    def test_tuples(self):
+        counter = KeyValueCounter(self.inp)
+        self.assertListEqual(
+            list(counter.tuples()),
+            [('id', 1, 3), ('u', 1, 1), ('u', 2, 2), ('id', 2, 1)],
+        )
+        self.assertTupleEqual(
+            counter.columns(),
+            (('id', 'u', 'u', 'id'), (1, 1, 2, 2), (3, 1, 2, 1)),
+        )
+        self.assertTupleEqual(KeyValueCounter().columns(), ((), (), ()))
+
+    def test_top(self):
+        counter = KeyValueCounter(self.inp)
+        self.assertListEqual(counter.top(2), [('id', 1, 3), ('u', 2, 2)])
+        self.assertListEqual(counter.top(0), [])
+        self.assertListEqual(
+            list(counter.filter(min_count=2)),
+            [('id', 1, 3), ('u', 2, 2)],
+        )
+        self.assertListEqual(list(counter.filter(min_count=4)), [])
+
+    def test_pickle(self):
+        counter = KeyValueCounter(self.inp)
+        restored = pickle.loads(pickle.dumps(counter))
+        self.assertListEqual(list(restored), list(counter))
+
+
+class ParallelTests(TestCase):
+
+    def setUp(self):
+        self.inp = [{'id': i % 7, 'u': i % 3, 'name': 'x'} for i in range(100)]
+
+    def test_same_as_serial(self):
+        out = list(sum_of_keys(self.inp))
+        self.assertListEqual(list(sum_of_keys(self.inp, workers=2)), out)
+        counter = count_parallel(iter(self.inp), workers=2, batch_size=9)
+        self.assertListEqual(list(counter), out)
+
+    def test_empty(self):
+        self.assertListEqual(list(sum_of_keys([], workers=2)), [])
+
+    def test_encode_batch(self):
+        batch = [{'id': 1, 'u': 2}, {'u': 3}, {'id': 4, 'u': 2}, {}]
+        shapes, shape_ids, values = encode_batch(batch)
+        self.assertTupleEqual(shapes, (('id', 'u'), ('u',), ()))
+        self.assertListEqual(list(shape_ids), [0, 1, 0, 2])
+        self.assertListEqual(list(decode_pairs(shapes, shape_ids, values)), [
+            ('id', 1), ('u', 2), ('u', 3), ('id', 4), ('u', 2),
+        ])
+
+    def test_different_keys(self):
+        inp = [{'id': i % 7, 'x': i % 2} if i % 3 else {'u': i % 5}
+               for i in range(100)]
+        counter = count_parallel(inp, workers=2, batch_size=9)
+        self.assertListEqual(list(counter), list(sum_of_keys(inp)))
+
+
+class SpaceSavingCounterTests(TestCase):
+
+    def setUp(self):
+        # skewed data: pair ('id', i) occurs about 1000 / i times
+        self.inp = [
+            {'id': i, 'u': (i * j) % 500}
+            for i in range(1, 200)
+            for j in range(1000 // i)
+        ]
+        self.exact = {
+            (item['key'], item['value']): item['count']
+            for item in sum_of_keys(self.inp)
+        }
+        self.total = sum(self.exact.values())
+
+    def check_accuracy(self, counter):
+        self.assertLessEqual(len(counter), counter.capacity)
+        self.assertEqual(counter.total, self.total)
+
+        found = set()
+        for item in counter:
+            pair = item['key'], item['value']
+            found.add(pair)
+            error = counter.error(*pair)
+            self.assertLessEqual(error, counter.error_bound)
+            self.assertLessEqual(self.exact[pair], item['count'])
+            self.assertGreaterEqual(self.exact[pair], item['count'] - error)
+
+        # every frequent pair must be found
+        for pair, count in self.exact.items():
+            if count > counter.error_bound:
+                self.assertIn(pair, found)
+
+    def test_accuracy(self):
+        counter = SpaceSavingCounter(50, self.inp)
+        self.check_accuracy(counter)
+        top = [item['value'] for item in list(counter)[:3]]
+        self.assertListEqual(top, [1, 2, 3])
+
+    def test_from_error(self):
+        counter = SpaceSavingCounter.from_error(0.01, self.inp)
+        self.assertEqual(counter.capacity, 100)
+        self.check_accuracy(counter)
+
+    def test_exact_when_enough_capacity(self):
+        counter = SpaceSavingCounter(len(self.exact), self.inp)
+        self.assertListEqual(
+            sorted(map(tuple, map(dict.values, counter))),
+            sorted(map(tuple, map(dict.values, sum_of_keys(self.inp)))),
+        )
+
+    def test_merge(self):
+        middle = len(self.inp) // 3
+        counter = SpaceSavingCounter(50, self.inp[:middle])
+        counter += SpaceSavingCounter(50, self.inp[middle:])
+        self.assertEqual(counter.total, self.total)
+        self.assertLessEqual(len(counter), 50)
+        for item in counter:
+            pair = item['key'], item['value']
+            self.assertLessEqual(self.exact[pair], item['count'])
+
+        with self.assertRaises(TypeError):
+            counter.merge(KeyValueCounter())
+
+    def test_sum_of_keys(self):
+        out = list(sum_of_keys(self.inp, capacity=50))
+        self.assertListEqual(out, list(SpaceSavingCounter(50, self.inp)))
+        self.assertListEqual(
+            list(sum_of_keys(self.inp, workers=2, capacity=500))[:5],
+            list(sum_of_keys(self.inp, capacity=500))[:5],
+        )
+
+    def test_raise(self):
+        with self.assertRaises(ValueError):
+            SpaceSavingCounter(0)
+        with self.assertRaises(ValueError):
+            SpaceSavingCounter.from_error(2)
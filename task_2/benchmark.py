@@ -0,0 +1,107 @@
+""" Benchmark of dicts merging.
+
+Usage:
+    python -m task_2.benchmark
+"""
+import logging
+from functools import reduce
+from time import perf_counter as pc
+
+from .problem_2 import MergedView, merge_dicts, merge_dicts_report
+
+# 30 dicts with 10000 keys, each dict overlaps with the next one by half
+DICTS = [
+    {f'key_{i * 5000 + j}': j for j in range(10000)}
+    for i in range(30)
+]
+
+
+def old_merge_dicts(d1, d2):
+    """ Previous version of merge_dicts: logging setup and one warning
+    for every conflicting key """
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s %(name)-12s %(levelname)-8s %(message)s'
+    )
+    logger = logging.getLogger('merge_dicts')
+
+    for key, value in d2.items():
+        if d1.get(key, None):
+            logger.warning(f'Key "{key}" exists in both dicts. Value "{value}"'
+                           f' from d2 can be lost')
+
+    return {**d2, **d1}
+
+
+def measure(func, *args, repeat=5):
+    """ Return the best time of `repeat` calls func(*args) """
+    times = []
+    for _ in range(repeat):
+        t = pc()
+        func(*args)
+        times.append(pc() - t)
+    return min(times)
+
+
+def bench_view():
+    """ Compare pairwise merges with MergedView """
+    keys = [f'key_{i}' for i in range(0, 150000, 1500)]
+
+    def pairwise():
+        merged = reduce(merge_dicts, DICTS)
+        return [merged[key] for key in keys]
+
+    def view():
+        merged = MergedView(*DICTS)
+        return [merged[key] for key in keys]
+
+    def materialized():
+        return MergedView(*DICTS).materialize()
+
+    # pairwise merges log a warning for every conflict
+    logging.disable(logging.WARNING)
+    old = measure(pairwise)
+    logging.disable(logging.NOTSET)
+
+    print(f'{len(DICTS)} dicts, {len(keys)} reads. '
+          f'pairwise merge_dicts: {old:.4f} s')
+    for title, func in (('MergedView', view),
+                        ('MergedView.materialize', materialized)):
+        new = measure(func)
+        print(f'{len(DICTS)} dicts, {len(keys)} reads. {title}: {new:.6f} s, '
+              f'speedup: {old / new:.1f}x')
+
+
+def bench_conflicts():
+    """ Compare cost of conflicts reporting on 10000 overlapping keys """
+    d1, d2 = DICTS[0], DICTS[1]
+    d2 = {**d2, **{key: 0 for key in d1}}
+
+    # records are created, but not printed
+    root = logging.getLogger()
+    handlers, root.handlers = root.handlers, [logging.NullHandler()]
+    logger = logging.getLogger('merge_dicts')
+
+    for title, level in (('enabled', logging.WARNING),
+                         ('filtered', logging.ERROR)):
+        logger.setLevel(level)
+        old = measure(old_merge_dicts, d1, d2)
+        new = measure(merge_dicts, d1, d2)
+        print(f'10000 conflicts, warnings {title}. '
+              f'old merge_dicts: {old:.4f} s, merge_dicts: {new:.4f} s, '
+              f'speedup: {old / new:.1f}x')
+
+    report = measure(merge_dicts_report, d1, d2)
+    print(f'10000 conflicts. merge_dicts_report: {report:.4f} s')
+
+    logger.setLevel(logging.NOTSET)
+    root.handlers = handlers
+
+
+def main():
+    bench_view()
+    bench_conflicts()
+
+
+if __name__ == '__main__':
+    main()
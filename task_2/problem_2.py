@@ -1,10 +1,22 @@
 import logging
+from collections import namedtuple
+from collections.abc import Mapping
+
+# marker of missing value
+MISSING = object()
+
+logger = logging.getLogger('merge_dicts')
+
+MergeResult = namedtuple('MergeResult', ['merged', 'conflicts'])
 
 
 def merge_dicts(d1, d2):
     """ Merge dicts d1 and d2. If key exists in d1 and d2,
     the value from the d1 will be used.
 
+    Conflicting keys are reported by one warning to 'merge_dicts' logger.
+    They are searched only if the warning will be logged.
+
     Example:
         >> d1 = {"a": 1, "b":2}
         >> d2 = {"b": 3, "c":4}
@@ -13,15 +25,284 @@ def merge_dicts(d1, d2):
         {"a": 1, "b": 2, "c": 4}
     """
 
-    logging.basicConfig(
-        level=logging.WARNING,
-        format='%(asctime)s %(name)-12s %(levelname)-8s %(message)s'
-    )
-    logger = logging.getLogger('merge_dicts')
+    if logger.isEnabledFor(logging.WARNING):
+        conflicts = d1.keys() & d2.keys()
+        if conflicts:
+            lost = {key: d2[key] for key in conflicts}
+            logger.warning('%d keys exist in both dicts. Values from d2 '
+                           'can be lost: %s', len(lost), lost)
+
+    return {**d2, **d1}
+
+
+def merge_dicts_report(d1, d2):
+    """ Merge dicts d1 and d2 as `merge_dicts`, but return conflicts
+    instead of logging them.
+
+    Example:
+        >> merge_dicts_report({"a": 1, "b": 2}, {"b": 3, "c": 4})
+        MergeResult(merged={'b': 2, 'c': 4, 'a': 1}, conflicts={'b': (2, 3)})
+
+    Args:
+        d1(dict): dict with values of high priority.
+        d2(dict): dict with values of low priority.
+
+    Returns:
+        MergeResult: named tuple with fields:
+            merged(dict) - merged dict,
+            conflicts(dict) - {key: (value_from_d1, value_from_d2)} for
+                keys, which exist in both dicts
+
+    """
+    conflicts = {key: (d1[key], d2[key]) for key in d2 if key in d1}
+    return MergeResult({**d2, **d1}, conflicts)
+
+
+def resolve_conflict(path, left, right, strategy):
+    """ Choose value for key, which exists in both dicts.
 
-    for key, value in d2.items():
-        if d1.get(key, None):
-            logger.warning(f'Key "{key}" exists in both dicts. Value "{value}"'
-                           f' from d2 can be lost')
+    Args:
+        path(tuple): keys from the root to the conflicting key.
+        left: value from the first dict.
+        right: value from the second dict.
+        strategy(str or Callable): see `deep_merge`.
 
+    Returns:
+        value for the key
+
+    """
+    if strategy == 'left':
+        return left
+    if strategy == 'right':
+        if type(left) is type(right) and left == right:
+            # equal values: keep left one, so its dict can be shared
+            return left
+        return right
+    if strategy == 'concat':
+        if isinstance(left, list) and isinstance(right, list):
+            return left + right
+        return left
+    return strategy(path, left, right)
+
+
+def deep_merge(d1, d2, strategy='left', path=()):
+    """ Merge nested dicts d1 and d2 recursively.
+
+    Result shares unchanged subtrees with d1 and d2 (they are not copied):
+    if merging of dicts adds or changes nothing, d1 (or d2) itself is
+    returned, so only dicts with changed keys are created. Don't change
+    merged dicts in place, if result is used.
+
+    Example:
+        >> d1 = {"db": {"host": "localhost"}, "debug": True}
+        >> d2 = {"db": {"host": "db", "port": 5432}, "tags": ["a"]}
+        >> deep_merge(d1, d2)
+        {"db": {"host": "localhost", "port": 5432}, "tags": ["a"],
+         "debug": True}
+
+    Args:
+        d1(dict): first dict.
+        d2(dict): second dict.
+        strategy(str or Callable): how to resolve conflicts of values,
+            which are not both dicts:
+            "left" - value from d1 is used (as in `merge_dicts`),
+            "right" - value from d2 is used,
+            "concat" - lists are concatenated, otherwise value from d1,
+            callable - its result is used, it's called with arguments
+                (path, value_from_d1, value_from_d2), where path is tuple
+                of keys from the root.
+        path(tuple): keys from the root to d1 and d2.
+
+    Returns:
+        dict: merged dict
+
+    """
+    if strategy not in ('left', 'right', 'concat') and not callable(strategy):
+        raise ValueError(f'Strategy "{strategy}" is not supported')
+
+    if not d2 or d1 is d2 and strategy in ('left', 'right'):
+        return d1
+    if not d1:
+        return d2
+
+    values = {}
+    for key in d1.keys() & d2.keys():
+        left, right = d1[key], d2[key]
+        key_path = path + (key,)
+        if left is right and strategy in ('left', 'right'):
+            values[key] = left
+        elif isinstance(left, Mapping) and isinstance(right, Mapping):
+            values[key] = deep_merge(left, right, strategy, key_path)
+        else:
+            values[key] = resolve_conflict(key_path, left, right, strategy)
+
+    # one of dicts is merged dict already
+    if len(values) == len(d2) and \
+            all(value is d1[key] for key, value in values.items()):
+        return d1
+    if len(values) == len(d1) and \
+            all(value is d2[key] for key, value in values.items()):
+        return d2
+
+    result = {**d2, **d1}
+    result.update(values)
+    return result
+
+
+def merge_records(d1, d2):
+    """ Merge dicts d1 and d2 as `merge_dicts`, but without logging """
     return {**d2, **d1}
+
+
+def merge_sorted_streams(left, right, key, merge):
+    """ Sort-merge join of streams, which are sorted by key """
+    left, right = iter(left), iter(right)
+    left_record = next(left, MISSING)
+    right_record = next(right, MISSING)
+
+    while left_record is not MISSING and right_record is not MISSING:
+        left_key, right_key = left_record[key], right_record[key]
+        if left_key == right_key:
+            yield merge(left_record, right_record)
+            left_record = next(left, MISSING)
+            right_record = next(right, MISSING)
+        elif left_key < right_key:
+            yield left_record
+            left_record = next(left, MISSING)
+        else:
+            yield right_record
+            right_record = next(right, MISSING)
+
+        if left_record is not MISSING and left_record[key] < left_key or \
+                right_record is not MISSING and right_record[key] < right_key:
+            raise ValueError(f'Streams are not sorted by "{key}"')
+
+    # one of streams is over, the rest of the other one is yielded as is
+    if left_record is not MISSING:
+        yield left_record
+        yield from left
+    if right_record is not MISSING:
+        yield right_record
+        yield from right
+
+
+def merge_unsorted_streams(left, right, key, merge):
+    """ Hash join of streams, right stream is loaded to memory """
+    right_index = {record[key]: record for record in right}
+
+    for record in left:
+        right_record = right_index.pop(record[key], MISSING)
+        if right_record is MISSING:
+            yield record
+        else:
+            yield merge(record, right_record)
+
+    yield from right_index.values()
+
+
+def merge_streams(left, right, key='id', presorted=False, merge=None):
+    """ Merge two streams of records (dicts) with the same key.
+
+    Records with the same key are merged as in `merge_dicts` (values from
+    the left record are used), records without pair are yielded as is.
+    Values of key must be unique in each stream.
+
+    Example:
+        >> left = [{"id": 1, "a": 1}, {"id": 2, "a": 2}]
+        >> right = [{"id": 2, "a": 3, "b": 4}, {"id": 3}]
+        >> list(merge_streams(left, right))
+        [{"id": 1, "a": 1}, {"id": 2, "a": 2, "b": 4}, {"id": 3}]
+
+    Args:
+        left(Iterable[dict]): records with values of high priority.
+        right(Iterable[dict]): records with values of low priority.
+        key(Hashable): name of key, which identifies records.
+        presorted(bool): True, if both streams are sorted by key. Then
+            streams are merged in constant memory. Otherwise, the right
+            stream is loaded to memory, so it should be the smaller one.
+        merge(Callable): function to merge two records with the same key,
+            `merge_records` by default.
+
+    Returns:
+        Iterator[dict]: merged records. If presorted, they are sorted
+            by key. Otherwise, records in order of the left stream and then
+            records from the right stream without pair.
+
+    """
+    merge = merge or merge_records
+    if presorted:
+        return merge_sorted_streams(left, right, key, merge)
+    return merge_unsorted_streams(left, right, key, merge)
+
+
+class MergedView(Mapping):
+    """ Read-only view of several merged dicts.
+
+    Dicts are not copied, values are looked up in dicts on every read.
+    If key exists in several dicts, the value from the dict with the
+    highest precedence is used.
+
+    Example:
+        >> view = MergedView({"a": 1}, {"a": 2, "b": 3})
+        >> view["a"], view["b"]
+        (1, 3)
+        >> MergedView({"a": 1}, {"a": 2}, precedence='last')["a"]
+        2
+    """
+    __slots__ = ('dicts',)
+
+    def __init__(self, *dicts, precedence='first'):
+        """ Init function which create view of dicts.
+
+        Args:
+            dicts(Mapping): dicts to merge.
+            precedence(str): "first" - value from the first dict is used
+                (as in `merge_dicts`), "last" - from the last dict.
+
+        Returns:
+            NoneType: return nothing
+
+        """
+        if precedence == 'first':
+            self.dicts = dicts
+        elif precedence == 'last':
+            self.dicts = dicts[::-1]
+        else:
+            raise ValueError(f'Precedence "{precedence}" is not supported')
+
+    def __getitem__(self, key):
+        for diction in self.dicts:
+            value = diction.get(key, MISSING)
+            if value is not MISSING:
+                return value
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return any(key in diction for diction in self.dicts)
+
+    def __iter__(self):
+        # keys in the same order as in materialized dict
+        seen = set()
+        for diction in reversed(self.dicts):
+            for key in diction:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self):
+        return len(set().union(*self.dicts))
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.materialize()})'
+
+    def materialize(self):
+        """ Copy merged dicts to new dict.
+
+        Returns:
+            dict: merged dict
+
+        """
+        result = {}
+        for diction in reversed(self.dicts):
+            result.update(diction)
+        return result
@@ -1,6 +1,8 @@
 from unittest import TestCase
 
-from .problem_2 import merge_dicts
+from .problem_2 import (
+    MergedView, deep_merge, merge_dicts, merge_dicts_report, merge_streams,
+)
 
 
 class Problem1Tests(TestCase):
@@ -31,3 +33,210 @@ class Problem1Tests(TestCase):
         d2 = {'c': 3, 'd': 4}
         out = {'a': 1, 'b': 2, 'c': 3, 'd': 4}
         self.assertDictEqual(merge_dicts(d1, d2), out)
+
+    def test_one_warning(self):
+        d1 = {'a': 1, 'b': 2, 'c': 0}
+        d2 = {'b': 3, 'c': 4}
+        with self.assertLogs('merge_dicts', 'WARNING') as logs:
+            merge_dicts(d1, d2)
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("'b': 3", logs.output[0])
+        self.assertIn("'c': 4", logs.output[0])
+
+    def test_report(self):
+        d1 = {'a': 1, 'b': 2, 'c': 0}
+        d2 = {'b': 3, 'c': 4, 'd': 5}
+        result = merge_dicts_report(d1, d2)
+        self.assertDictEqual(result.merged, merge_dicts(d1, d2))
+        self.assertDictEqual(result.conflicts, {'b': (2, 3), 'c': (0, 4)})
+
+        merged, conflicts = merge_dicts_report({}, d2)
+        self.assertDictEqual(merged, d2)
+        self.assertDictEqual(conflicts, {})
+
+
+class DeepMergeTests(TestCase):
+
+    def setUp(self):
+        self.d1 = {
+            'db': {'host': 'localhost', 'options': {'timeout': 1}},
+            'tags': ['a'],
+            'cache': {'size': 10},
+        }
+        self.d2 = {
+            'db': {'host': 'db', 'port': 5432, 'options': {'retry': 3}},
+            'tags': ['b'],
+            'logging': {'level': 'INFO'},
+        }
+
+    def test_left(self):
+        out = {
+            'db': {
+                'host': 'localhost',
+                'port': 5432,
+                'options': {'timeout': 1, 'retry': 3},
+            },
+            'tags': ['a'],
+            'logging': {'level': 'INFO'},
+            'cache': {'size': 10},
+        }
+        self.assertDictEqual(deep_merge(self.d1, self.d2), out)
+
+    def test_right(self):
+        merged = deep_merge(self.d1, self.d2, 'right')
+        self.assertEqual(merged['db']['host'], 'db')
+        self.assertListEqual(merged['tags'], ['b'])
+        self.assertDictEqual(merged['db']['options'],
+                             {'timeout': 1, 'retry': 3})
+
+    def test_concat(self):
+        merged = deep_merge(self.d1, self.d2, 'concat')
+        self.assertListEqual(merged['tags'], ['a', 'b'])
+        self.assertEqual(merged['db']['host'], 'localhost')
+
+    def test_callback(self):
+        def callback(path, left, right):
+            return path
+
+        merged = deep_merge(self.d1, self.d2, callback)
+        self.assertTupleEqual(merged['db']['host'], ('db', 'host'))
+        self.assertTupleEqual(merged['tags'], ('tags',))
+
+    def test_sharing(self):
+        merged = deep_merge(self.d1, self.d2)
+        self.assertIs(merged['cache'], self.d1['cache'])
+        self.assertIs(merged['logging'], self.d2['logging'])
+        self.assertIs(merged['tags'], self.d1['tags'])
+        self.assertIs(deep_merge(self.d1, {}), self.d1)
+        self.assertIs(deep_merge({}, self.d2), self.d2)
+
+    def test_sharing_unchanged(self):
+        d1 = {'k1': {'a': {'b': 1}, 'c': [1]}, 'k2': {'d': 1}}
+        d2 = {'k1': {'a': {'b': 1}, 'c': [1]}, 'k2': {'d': 2}}
+        merged = deep_merge(d1, d2)
+        self.assertIs(merged['k1'], d1['k1'])
+        self.assertIs(merged['k2'], d1['k2'])
+        merged = deep_merge(d1, d2, 'right')
+        self.assertIs(merged['k1'], d1['k1'])
+        self.assertIs(merged['k2'], d2['k2'])
+
+        self.assertIs(deep_merge(d1, d1), d1)
+        self.assertIs(deep_merge(d1, {'k2': {}}), d1)
+        self.assertIs(deep_merge({'k2': {}}, d2), d2)
+        self.assertListEqual(deep_merge(d1, d1, 'concat')['k1']['c'], [1, 1])
+
+    def test_inputs_not_changed(self):
+        deep_merge(self.d1, self.d2, 'concat')
+        self.assertDictEqual(self.d1['db'],
+                             {'host': 'localhost', 'options': {'timeout': 1}})
+        self.assertListEqual(self.d2['tags'], ['b'])
+
+    def test_raise(self):
+        with self.assertRaises(ValueError):
+            deep_merge(self.d1, self.d2, 'middle')
+
+
+class MergeStreamsTests(TestCase):
+
+    def setUp(self):
+        self.left = [{'id': 1, 'a': 1}, {'id': 3, 'a': 3}, {'id': 4, 'a': 4}]
+        self.right = [{'id': 0}, {'id': 3, 'a': 0, 'b': 3}, {'id': 5}]
+
+    def test_sorted(self):
+        merged = merge_streams(iter(self.left), iter(self.right),
+                               presorted=True)
+        self.assertListEqual(list(merged), [
+            {'id': 0},
+            {'id': 1, 'a': 1},
+            {'id': 3, 'a': 3, 'b': 3},
+            {'id': 4, 'a': 4},
+            {'id': 5},
+        ])
+
+    def test_unsorted(self):
+        merged = merge_streams(self.left[::-1], self.right)
+        self.assertListEqual(list(merged), [
+            {'id': 4, 'a': 4},
+            {'id': 3, 'a': 3, 'b': 3},
+            {'id': 1, 'a': 1},
+            {'id': 0},
+            {'id': 5},
+        ])
+
+    def test_lazy(self):
+        def left():
+            yield {'id': 1}
+            raise RuntimeError
+
+        merged = merge_streams(left(), self.right, presorted=True)
+        self.assertDictEqual(next(merged), {'id': 0})
+        self.assertDictEqual(next(merged), {'id': 1})
+        with self.assertRaises(RuntimeError):
+            next(merged)
+
+    def test_not_sorted(self):
+        with self.assertRaises(ValueError):
+            list(merge_streams(self.left[::-1], self.right, presorted=True))
+
+    def test_key_and_merge(self):
+        left = [{'name': 'x', 'tags': ['a']}]
+        right = [{'name': 'x', 'tags': ['b']}]
+        merged = merge_streams(
+            left, right, key='name',
+            merge=lambda d1, d2: deep_merge(d1, d2, 'concat'),
+        )
+        self.assertListEqual(list(merged), [{'name': 'x', 'tags': ['a', 'b']}])
+
+    def test_empty(self):
+        for presorted in (True, False):
+            self.assertListEqual(
+                list(merge_streams([], self.right, presorted=presorted)),
+                self.right,
+            )
+            self.assertListEqual(
+                list(merge_streams(self.left, [], presorted=presorted)),
+                self.left,
+            )
+
+
+class MergedViewTests(TestCase):
+
+    def setUp(self):
+        self.dicts = [{'a': 1, 'b': 2}, {'b': 3, 'c': 4}, {'c': 5, 'd': 0}]
+
+    def test_same_as_merge_dicts(self):
+        view = MergedView(*self.dicts)
+        out = merge_dicts(merge_dicts(*self.dicts[:2]), self.dicts[2])
+        self.assertDictEqual(dict(view), out)
+        self.assertDictEqual(view.materialize(), out)
+        self.assertListEqual(list(view), list(out))
+        self.assertEqual(len(view), 4)
+
+    def test_precedence(self):
+        view = MergedView(*self.dicts, precedence='last')
+        self.assertDictEqual(
+            view.materialize(),
+            {'a': 1, 'b': 3, 'c': 5, 'd': 0},
+        )
+        with self.assertRaises(ValueError):
+            MergedView(*self.dicts, precedence='middle')
+
+    def test_lazy(self):
+        d1 = {'a': 1}
+        view = MergedView(d1, {'a': 2})
+        d1['a'] = 10
+        self.assertEqual(view['a'], 10)
+        self.assertIn('a', view)
+        self.assertNotIn('z', view)
+        self.assertEqual(view.get('z', 0), 0)
+        with self.assertRaises(KeyError):
+            view['z']
+
+    def test_read_only(self):
+        view = MergedView(*self.dicts)
+        with self.assertRaises(TypeError):
+            view['a'] = 1
+
+    def test_empty(self):
+        self.assertDictEqual(dict(MergedView()), {})
+        self.assertEqual(len(MergedView({}, {})), 0)
@@ -0,0 +1,318 @@
+""" Benchmark of matrix implementations.
+
+Usage:
+    python -m task_3.benchmark
+"""
+import os
+import tracemalloc
+from array import array
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter as pc
+
+from .lazy import lazy
+from .problem_3 import (
+    Matrix, blas_matmul, blocked_matmul, np, parallel_matmul, write_header,
+)
+from .sparse import SparseMatrix
+
+try:
+    from .numpy_matrix import NumpyMatrix
+except ImportError:  # numpy is not installed
+    NumpyMatrix = None
+
+
+def random_rows(count_rows, count_cols, seed=0):
+    """ Return list of rows with random numbers """
+    random = Random(seed)
+    return [
+        [random.uniform(-10, 10) for _ in range(count_cols)]
+        for _ in range(count_rows)
+    ]
+
+
+def measure(func, *args, repeat=3):
+    """ Return the best time of `repeat` calls func(*args) """
+    times = []
+    for _ in range(repeat):
+        t = pc()
+        func(*args)
+        times.append(pc() - t)
+    return min(times)
+
+
+def bench_numpy(size=1000):
+    """ Compare Matrix with NumpyMatrix on size*size matrices """
+    if NumpyMatrix is None:
+        print('numpy is not installed')
+        return
+
+    rows1, rows2 = random_rows(size, size, 1), random_rows(size, size, 2)
+    operations = {
+        '+': lambda a, b: a + b,
+        '-': lambda a, b: a - b,
+        '* 2': lambda a, b: a * 2,
+        '==': lambda a, b: a == a.copy(),
+        'T': lambda a, b: a.T,
+        '[::2, 10:]': lambda a, b: a[::2, 10:],
+    }
+    matrices = Matrix(rows1), Matrix(rows2)
+    numpy_matrices = NumpyMatrix(rows1), NumpyMatrix(rows2)
+
+    for title, operation in operations.items():
+        old = measure(operation, *matrices, repeat=1)
+        new = measure(operation, *numpy_matrices)
+        print(f'{size}x{size} {title}: Matrix: {old:.4f} s, '
+              f'NumpyMatrix: {new:.6f} s, speedup: {old / new:.0f}x')
+
+
+def naive_matmul(rows, other_rows):
+    """ Previous version of matmul: triple loop with column-wise access """
+    count_rows, count_cols = len(rows), len(other_rows[0])
+    tmp_rows = [array('f', [0] * count_cols) for _ in range(count_rows)]
+
+    for i in range(count_rows):
+        for j in range(count_cols):
+            q = (
+                rows[i][k] * other_rows[k][j]
+                for k in range(len(other_rows))
+            )
+            tmp_rows[i][j] = sum(q)
+
+    return tmp_rows
+
+
+def bench_matmul():
+    """ Compare matmul implementations on square matrices.
+
+    Pure python implementations are too slow for big matrices, so they are
+    measured only up to max size.
+    """
+    implementations = [
+        ('naive', naive_matmul, 200),
+        ('blocked', blocked_matmul, 500),
+    ]
+    if np is not None:
+        implementations.append(('BLAS', blas_matmul, 2000))
+
+    for size in (10, 50, 100, 200, 500, 1000, 2000):
+        rows1, rows2 = random_rows(size, size, 1), random_rows(size, size, 2)
+        rows1 = [array('f', row) for row in rows1]
+        rows2 = [array('f', row) for row in rows2]
+
+        times = []
+        for title, func, max_size in implementations:
+            if size <= max_size:
+                time = measure(func, rows1, rows2, repeat=1)
+                times.append(f'{title}: {time:.4f} s')
+        print(f'matmul {size}x{size}. ' + ', '.join(times))
+
+
+def bench_parallel(size=400):
+    """ Compare serial pure python matmul with parallel one """
+    rows1, rows2 = random_rows(size, size, 1), random_rows(size, size, 2)
+    rows1 = [array('f', row) for row in rows1]
+    rows2 = [array('f', row) for row in rows2]
+
+    serial = measure(blocked_matmul, rows1, rows2, repeat=1)
+    print(f'matmul {size}x{size}. serial: {serial:.4f} s')
+
+    for workers in (1, 2, 4, 8):
+        time = measure(parallel_matmul, rows1, rows2, workers, repeat=1)
+        print(f'matmul {size}x{size}. parallel: workers = {workers}. '
+              f'{time:.4f} s, speedup: {serial / time:.2f}x')
+
+
+def measure_memory(func, *args):
+    """ Return time and peak memory (MB) of func(*args) """
+    tracemalloc.start()
+    t = pc()
+    func(*args)
+    time = pc() - t
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return time, peak
+
+
+def bench_lazy(size=1000):
+    """ Compare eager and lazy evaluation of A + B - C * 2 """
+    a, b, c = (Matrix(random_rows(size, size, seed)) for seed in range(3))
+    expressions = {
+        'eager': lambda: a + b - c * 2,
+        'lazy': lambda: (lazy(a) + b - lazy(c) * 2).evaluate(),
+    }
+    for title, expression in expressions.items():
+        time = measure(expression)
+        peak = measure_memory(expression)[1]
+        print(f'{size}x{size} A + B - C * 2 {title}: {time:.4f} s, '
+              f'peak memory: {peak:.1f} MB')
+
+
+def random_sparse(size, count_items, seed=0):
+    """ Return size*size SparseMatrix with count_items random items """
+    random = Random(seed)
+    return SparseMatrix(size, size, (
+        (random.randrange(size), random.randrange(size), random.random())
+        for _ in range(count_items)
+    ))
+
+
+def bench_sparse(size=100000, count_items=1000000):
+    """ Measure SparseMatrix on big matrix with few nonzero items and
+    compare it with Matrix on smaller matrix with the same density """
+    time = measure(random_sparse, size, count_items, repeat=1)
+    peak = measure_memory(random_sparse, size, count_items)[1]
+    print(f'{size}x{size} sparse, {count_items} items. create: {time:.2f} s'
+          f', peak memory: {peak:.1f} MB')
+
+    s1, s2 = random_sparse(size, count_items, 1), random_sparse(
+        size, count_items, 2)
+    stored = sum(a.itemsize * len(a) for a in (s1.indptr, s1.indices,
+                                               s1.data))
+    print(f'{size}x{size} sparse: {stored / 2 ** 20:.1f} MB, '
+          f'dense would be: {4 * size * size / 2 ** 20:.0f} MB')
+
+    column = Matrix([1] for _ in range(size))
+    operations = {
+        '+': lambda: s1 + s2,
+        '* 2': lambda: s1 * 2,
+        'T': lambda: s1.T,
+        '@ sparse': lambda: s1 @ s2,
+        '@ dense column': lambda: s1 @ column,
+        '[::2, 1000:]': lambda: s1[::2, 1000:],
+    }
+    for title, operation in operations.items():
+        time = measure(operation, repeat=1)
+        print(f'{size}x{size} sparse {title}: {time:.2f} s')
+
+    # dense matrices of such size don't fit in memory
+    size, count_items = 1000, 100
+    s1, s2 = random_sparse(size, count_items, 1), random_sparse(
+        size, count_items, 2)
+    d1, d2 = s1.to_dense(), s2.to_dense()
+    for title, operation in (('+', lambda a, b: a + b),
+                             ('@', lambda a, b: a @ b)):
+        dense = measure(operation, d1, d2, repeat=1)
+        sparse = measure(operation, s1, s2)
+        print(f'{size}x{size}, {count_items} items {title}: dense: '
+              f'{dense:.4f} s, sparse: {sparse:.6f} s')
+
+
+def bench_mmap(count_rows=100000, count_cols=5000):
+    """ Measure memory-mapped matrix, which is bigger than memory of
+    the process should be """
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'matrix.bin')
+        block = [array('f', row) for row in random_rows(100, count_cols)]
+        with open(path, 'wb') as file:
+            write_header(file, 'f', count_rows, count_cols)
+            for _ in range(count_rows // len(block)):
+                for row in block:
+                    file.write(row)
+        print(f'{count_rows}x{count_cols} file: '
+              f'{os.path.getsize(path) / 2 ** 20:.0f} MB')
+
+        operations = {
+            'open_mmap': lambda: Matrix.open_mmap(path),
+            'first column': lambda: [
+                row[0] for row in Matrix.open_mmap(path).iter_rows()
+            ],
+            '[::1000, :10]': lambda: Matrix.open_mmap(path)[::1000, :10]
+            .materialize(),
+        }
+        for title, operation in operations.items():
+            time, peak = measure_memory(operation)
+            print(f'{count_rows}x{count_cols} mmap {title}: {time:.4f} s, '
+                  f'peak memory: {peak:.1f} MB')
+
+        small = Matrix(random_rows(1000, 1000))
+        small.save(path)
+        time = measure(small.save, path)
+        print(f'1000x1000 save: {time:.4f} s')
+        time, peak = measure_memory(Matrix.load, path)
+        print(f'1000x1000 load: {time:.4f} s, peak memory: {peak:.1f} MB')
+
+
+def bench_solve(size=300):
+    """ Compare first solve (with LU decomposition) with next solves """
+    rows, b = random_rows(size, size), random_rows(1, size, 3)[0]
+
+    def first_solve():
+        m = Matrix(rows)  # new matrix without cached decomposition
+        m.solve(b)
+
+    m = Matrix(rows)
+    first = measure(first_solve, repeat=1)
+    m.solve(b)
+    next_solve = measure(m.solve, b)
+    print(f'solve {size}x{size}. first: {first:.4f} s, '
+          f'next: {next_solve:.4f} s')
+    print(f'det {size}x{size} (cached): {measure(m.det):.6f} s, '
+          f'inv: {measure(m.inv, repeat=1):.4f} s')
+
+
+def old_repr(matrix):
+    """ Previous version of Matrix.__repr__: every cell is formatted
+    twice (for width of column and for output) """
+    def len_fmt(x):
+        return len(f'{x: ,.{matrix.precision}f}')
+
+    rows = list(matrix.iter_rows())
+    max_len_in_col = []
+    for num_col in range(matrix.count_cols):
+        max_len = 0
+        for num_row in range(matrix.count_rows):
+            current_len = len_fmt(rows[num_row][num_col])
+            max_len = max(max_len, current_len + (num_col != 0))
+        max_len_in_col.append(max_len)
+
+    lines = []
+    for num_row in range(matrix.count_rows):
+        cells = []
+        for num_col in range(matrix.count_cols):
+            cell = rows[num_row][num_col]
+            width = max_len_in_col[num_col]
+            cells.append(f'{cell:> #{width},.{matrix.precision}f}')
+        lines.append(''.join(cells))
+    return '\n'.join(map(str.rstrip, lines))
+
+
+def bench_repr():
+    """ Compare previous repr with full and summarized output """
+    m = Matrix(random_rows(1000, 1000))
+    old = measure(old_repr, m, repeat=1)
+    full = measure(m.to_string, float('inf'), repeat=1)
+    print(f'repr 1000x1000. old: {old:.4f} s, '
+          f'new full: {full:.4f} s, speedup: {old / full:.2f}x')
+
+    for size in (1000, 5000):
+        m = Matrix.zeros(size, size)
+        print(f'repr {size}x{size} summarized: {measure(repr, m):.6f} s')
+
+
+def bench_dtype(size=1000):
+    """ Measure memory of items and speed of elementwise operations for
+    every dtype """
+    rows = [[i * j % 1000 for j in range(size)] for i in range(size)]
+    for dtype in ('f', 'd', 'i', 'q'):
+        m = Matrix(rows, dtype=dtype)
+        memory = sum(row.itemsize * len(row) for row in m.rows) / 2 ** 20
+        time = measure(lambda: m * 3 + m)
+        print(f'{size}x{size} dtype {dtype!r}: items {memory:.1f} MB, '
+              f'm * 3 + m: {time:.4f} s')
+
+
+def main():
+    bench_numpy()
+    bench_matmul()
+    bench_parallel()
+    bench_lazy()
+    bench_sparse()
+    bench_mmap()
+    bench_solve()
+    bench_repr()
+    bench_dtype()
+
+
+if __name__ == '__main__':
+    main()
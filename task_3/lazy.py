@@ -0,0 +1,200 @@
+from array import array
+from numbers import Real
+
+from .problem_3 import (
+    DEFAULT_DTYPE, DimensionError, Matrix, result_dtype, scale_dtype,
+)
+
+
+def lazy(matrix):
+    """ Wrap matrix into lazy expression.
+
+    Operators of expression (+, -, unary -, * on number) don't calculate
+    anything, they build tree of expression. Tree is calculated by
+    evaluate() in one pass: all operations are fused to one function
+    of items, so temporary matrices are not created.
+
+    Example:
+        >>> A, B, C = map(lazy, (A, B, C))
+        >>> D = (A + B - C * 2).evaluate()
+
+    Args:
+        matrix(Matrix): matrix to wrap
+
+    Returns:
+        Expression: expression with one leaf
+    """
+    if isinstance(matrix, Expression):
+        return matrix
+    return Leaf(matrix)
+
+
+def as_expression(other):
+    """ Return expression for Matrix or Expression, or None for others """
+    if isinstance(other, Expression):
+        return other
+    if isinstance(other, Matrix):
+        return Leaf(other)
+    return None
+
+
+class Expression:
+    """ Base class of nodes of lazy expression """
+    size = 0, 0
+    dtype = DEFAULT_DTYPE  # dtype of result, like in eager operations
+
+    def leaves(self):
+        """ Iterate leaves of expression from left to right """
+        raise NotImplementedError
+
+    def source(self, names, constants):
+        """ Return python source of expression for one item.
+
+        Args:
+            names(Dict[int, str]): names of arguments for leaves
+                (by id of matrix)
+            constants(List[float]): numbers of expression, is filled by
+                node; number i is available in source as c{i}
+
+        Returns:
+            str: python expression
+        """
+        raise NotImplementedError
+
+    def compile(self):
+        """ Fuse expression to one function of items.
+
+        Returns:
+            1) function: function of items of matrices, returns item of
+                result
+            2) List[Matrix]: matrices, which items are arguments of function
+        """
+        names, matrices = {}, []
+        for leaf in self.leaves():
+            if id(leaf.matrix) not in names:
+                names[id(leaf.matrix)] = f'a{len(matrices)}'
+                matrices.append(leaf.matrix)
+
+        constants = []
+        body = self.source(names, constants)
+        arguments = ', '.join(names.values())
+        namespace = {f'c{i}': number for i, number in enumerate(constants)}
+        return eval(f'lambda {arguments}: {body}', namespace), matrices
+
+    def evaluate(self, precision=1):
+        """ Calculate expression in one pass over items.
+
+        Args:
+            precision(int): precision for printing of result.
+
+        Returns:
+            Matrix: result matrix
+        """
+        function, matrices = self.compile()
+        rows = [
+            array(self.dtype, map(function, *items))
+            for items in zip(*(matrix.iter_rows() for matrix in matrices))
+        ]
+
+        result = Matrix(precision=precision, dtype=self.dtype)
+        result.rows = rows
+        result.count_rows, result.count_cols = self.size
+        return result
+
+    ##################################################
+    # Operators
+    ##################################################
+
+    def __add__(self, other):
+        other = as_expression(other)
+        if other is None:
+            return NotImplemented
+        return BinaryOperation('+', self, other)
+
+    def __radd__(self, other):
+        other = as_expression(other)
+        if other is None:
+            return NotImplemented
+        return BinaryOperation('+', other, self)
+
+    def __sub__(self, other):
+        other = as_expression(other)
+        if other is None:
+            return NotImplemented
+        return BinaryOperation('-', self, other)
+
+    def __rsub__(self, other):
+        other = as_expression(other)
+        if other is None:
+            return NotImplemented
+        return BinaryOperation('-', other, self)
+
+    def __mul__(self, other):
+        if not isinstance(other, Real):
+            return NotImplemented
+        return Scale(self, other)
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __neg__(self):
+        return Scale(self, -1)
+
+    def __pos__(self):
+        return self
+
+
+class Leaf(Expression):
+    """ Matrix in expression """
+
+    def __init__(self, matrix):
+        if not isinstance(matrix, Matrix):
+            raise TypeError('Only Matrix can be lazy')
+        self.matrix = matrix
+        self.size = matrix.size
+        self.dtype = matrix.dtype
+
+    def leaves(self):
+        yield self
+
+    def source(self, names, constants):
+        return names[id(self.matrix)]
+
+
+class BinaryOperation(Expression):
+    """ Elementwise operation of two expressions with equal sizes """
+
+    def __init__(self, operator, left, right):
+        if left.size != right.size:
+            raise DimensionError
+        self.operator = operator
+        self.left, self.right = left, right
+        self.size = left.size
+        self.dtype = result_dtype(left.dtype, right.dtype)
+
+    def leaves(self):
+        yield from self.left.leaves()
+        yield from self.right.leaves()
+
+    def source(self, names, constants):
+        left = self.left.source(names, constants)
+        right = self.right.source(names, constants)
+        return f'({left} {self.operator} {right})'
+
+
+class Scale(Expression):
+    """ Expression, multiplied on number """
+
+    def __init__(self, operand, number):
+        self.operand = operand
+        self.number = number
+        self.size = operand.size
+        self.dtype = scale_dtype(operand.dtype, number)
+
+    def leaves(self):
+        return self.operand.leaves()
+
+    def source(self, names, constants):
+        operand = self.operand.source(names, constants)
+        constants.append(self.number)
+        return f'({operand} * c{len(constants) - 1})'
@@ -0,0 +1,90 @@
+from random import Random
+from unittest import TestCase
+
+from .lazy import Expression, lazy
+from .problem_3 import DimensionError, Matrix
+
+
+def random_matrix(count_rows, count_cols, seed=0):
+    # quarters are exact in float, so fused and eager results are equal
+    random = Random(seed)
+    return Matrix(
+        [random.randint(-100, 100) / 4 for _ in range(count_cols)]
+        for _ in range(count_rows)
+    )
+
+
+class TestLazy(TestCase):
+
+    def setUp(self):
+        self.a = random_matrix(20, 30, seed=1)
+        self.b = random_matrix(20, 30, seed=2)
+        self.c = random_matrix(20, 30, seed=3)
+
+    def assertMatrixEqual(self, m1, m2):
+        self.assertTupleEqual(m1.size, m2.size)
+        self.assertListEqual(list(m1), list(m2))
+
+    def test_build(self):
+        a, b, c = map(lazy, (self.a, self.b, self.c))
+        expression = a + b - c * 2
+        self.assertIsInstance(expression, Expression)
+        self.assertTupleEqual(expression.size, (20, 30))
+        self.assertIs(lazy(expression), expression)
+
+    def test_evaluate(self):
+        a, b, c = map(lazy, (self.a, self.b, self.c))
+        result = (a + b - c * 2).evaluate()
+        self.assertIsInstance(result, Matrix)
+        self.assertMatrixEqual(result, self.a + self.b - self.c * 2)
+
+        self.assertMatrixEqual((-a).evaluate(), -self.a)
+        self.assertMatrixEqual((+a).evaluate(), self.a)
+        self.assertMatrixEqual((0.5 * (a - b)).evaluate(),
+                               0.5 * (self.a - self.b))
+        self.assertMatrixEqual((a - (b - c)).evaluate(),
+                               self.a - (self.b - self.c))
+
+    def test_mixed(self):
+        a = lazy(self.a)
+        self.assertMatrixEqual((self.b + a).evaluate(), self.b + self.a)
+        self.assertMatrixEqual((self.b - a).evaluate(), self.b - self.a)
+        self.assertMatrixEqual((a - self.b).evaluate(), self.a - self.b)
+
+    def test_same_matrix(self):
+        a = lazy(self.a)
+        self.assertMatrixEqual((a + a + a).evaluate(), self.a * 3)
+
+    def test_view(self):
+        a = lazy(self.a[::2, 5:15])
+        b = lazy(self.b[10:, ::-3])
+        self.assertMatrixEqual((a - b).evaluate(),
+                               self.a[::2, 5:15] - self.b[10:, ::-3])
+
+    def test_dtype(self):
+        i = Matrix([(1, 2), (3, 4)], dtype='i')
+        d = Matrix([(1, 2), (3, 4)], dtype='d')
+        for expression, eager in ((lazy(i) * 2 - i, i * 2 - i),
+                                  (lazy(i) * 0.5 + d, i * 0.5 + d),
+                                  (lazy(d) - i, d - i)):
+            result = expression.evaluate()
+            self.assertEqual(result.dtype, eager.dtype)
+            self.assertEqual(result, eager)
+
+    def test_laziness(self):
+        expression = lazy(self.a) * 2
+        self.a[0, 0] = 1000
+        self.assertEqual(expression.evaluate()[0, 0], 2000)
+
+    def test_errors(self):
+        a = lazy(self.a)
+        with self.assertRaises(DimensionError):
+            a + self.a.T
+        with self.assertRaises(TypeError):
+            a + 1
+        with self.assertRaises(TypeError):
+            a * self.b
+        with self.assertRaises(TypeError):
+            'test' - a
+        with self.assertRaises(TypeError):
+            lazy([[1, 2]])
@@ -0,0 +1,304 @@
+from array import array
+from collections.abc import Iterable
+from numbers import Integral, Real
+
+import numpy as np
+
+from .problem_3 import (
+    DEFAULT_DTYPE, FLOAT_DTYPES, HEADER, DimensionError, Matrix, check_dtype,
+    int_matmul, int_work_dtype, max_abs, read_header, split_2d_slice,
+    to_int_dtype, write_header,
+)
+
+
+def as_array(matrix):
+    """ Return items of matrix as 2d NumPy array of its dtype (without
+    copy, if matrix is NumpyMatrix) """
+    if isinstance(matrix, NumpyMatrix):
+        return matrix.rows
+    # iter_rows() doesn't copy items of views
+    return np.array(list(matrix.iter_rows()), dtype=matrix.dtype).reshape(
+        matrix.size,
+    )
+
+
+def index_to_slice(index, length):
+    """ Convert int index to slice, so slicing keeps dimension """
+    if isinstance(index, Integral):
+        index = range(length)[index]
+        return slice(index, index + 1)
+    return index
+
+
+class NumpyMatrix(Matrix):
+    """ Matrix, which stores items in one contiguous NumPy array.
+
+    Arithmetic, comparison, transpose and slicing are vectorized,
+    public API is the same as in Matrix. dtype of Matrix is dtype of the
+    array ('f' is float32, 'd' is float64, 'i' is int32, 'q' is int64).
+    """
+
+    def __init__(self, iterable=None, precision=1, dtype=None):
+        """ Init function which create matrix from args.
+
+        Args:
+            iterable(Iterable): iter of iterable objects, every object must
+                be number (float or int), or 2d NumPy array.
+            precision(int): precision for printing.
+            dtype(str): typecode of items, by default dtype of iterable,
+                if it's Matrix, else 'f'.
+
+        Returns:
+            NoneType: return nothing
+
+        """
+        self.precision = precision
+        if dtype is None:
+            dtype = iterable.dtype if isinstance(iterable, Matrix) else \
+                DEFAULT_DTYPE
+        check_dtype(dtype)
+        self.dtype = dtype
+        self.cache = {}
+
+        if isinstance(iterable, np.ndarray):
+            if iterable.ndim != 2:
+                raise DimensionError
+            data = np.array(iterable, dtype=dtype, order='C')
+        elif isinstance(iterable, Matrix):
+            data = np.array(as_array(iterable), dtype=dtype, order='C')
+        else:
+            rows = [array(dtype, row) for row in iterable] if iterable else []
+            count_cols = max(map(len, rows), default=0)
+            if count_cols != min(map(len, rows), default=0):
+                raise DimensionError
+            data = np.array(rows, dtype=dtype).reshape(
+                len(rows), count_cols,
+            )
+
+        self.rows = data
+        self.count_rows, self.count_cols = data.shape
+
+    def copy(self):
+        return NumpyMatrix(self.rows, dtype=self.dtype)
+
+    def astype(self, dtype):
+        return NumpyMatrix(self.rows, dtype=dtype)
+
+    @property
+    def T(self):
+        """ Property for create transpose matrix and return it
+
+        Return:
+            NumpyMatrix: transposed matrix
+        """
+        return NumpyMatrix(self.rows.T, dtype=self.dtype)
+
+    @classmethod
+    def zeros(cls, count_rows, count_cols, dtype=DEFAULT_DTYPE):
+        return cls(np.zeros((count_rows, count_cols)), dtype=dtype)
+
+    @classmethod
+    def even(cls, count_rows, dtype=DEFAULT_DTYPE):
+        return cls(np.eye(count_rows), dtype=dtype)
+
+    def save(self, path):
+        with open(path, 'wb') as file:
+            write_header(file, self.dtype, self.count_rows, self.count_cols)
+            self.rows.astype('<' + self.dtype).tofile(file)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as file:
+            dtype, count_rows, count_cols = read_header(file)
+            count = count_rows * count_cols
+            data = np.fromfile(file, dtype='<' + dtype, count=count)
+        if data.size != count:
+            raise ValueError('File is too short for matrix items')
+        return cls(data.reshape(count_rows, count_cols), dtype=dtype)
+
+    @classmethod
+    def open_mmap(cls, path, writable=False):
+        """ Open file in binary format as matrix, which items are
+        np.memmap (items are read from disk when they are used) """
+        with open(path, 'rb') as file:
+            dtype, count_rows, count_cols = read_header(file)
+
+        matrix = cls(dtype=dtype)
+        matrix.rows = np.memmap(
+            path, dtype='<' + dtype, mode='r+' if writable else 'r',
+            offset=HEADER.size, shape=(count_rows, count_cols),
+        )
+        matrix.count_rows, matrix.count_cols = count_rows, count_cols
+        return matrix
+
+    def __getitem__(self, item):
+        # get horizontal and vertical slices
+        h_slice, v_slice = split_2d_slice(item)
+
+        if not isinstance(h_slice, (Integral, slice)) or \
+                (v_slice and not isinstance(v_slice, (Integral, slice))):
+            raise TypeError('Slice must be int, slice, or tuple of them')
+
+        # If need return one number
+        if isinstance(h_slice, Integral) and isinstance(v_slice, Integral):
+            return self.rows[h_slice, v_slice].item()
+
+        h_slice = index_to_slice(h_slice, self.count_rows)
+        if v_slice is None:
+            v_slice = slice(None)
+        v_slice = index_to_slice(v_slice, self.count_cols)
+
+        data = self.rows[h_slice, v_slice]
+        if data.size == 0:
+            return None
+
+        return NumpyMatrix(data, dtype=self.dtype)
+
+    def __setitem__(self, key, value):
+        h_slice, v_slice = split_2d_slice(key)
+
+        if isinstance(value, Real) and isinstance(h_slice, Integral) \
+                and isinstance(v_slice, Integral):
+            # if setting M[i][j] = float
+            if self.dtype not in FLOAT_DTYPES and \
+                    not isinstance(value, Integral):
+                raise TypeError('Items of int matrix must be int')
+            self.rows[h_slice, v_slice] = value
+            self.reset_cache()
+            return
+        if isinstance(value, Iterable) and isinstance(h_slice, Integral) \
+                and v_slice is None:
+            # if setting M[i] = [...]
+            row = array(self.dtype, value)
+            if len(row) != self.count_cols:
+                raise DimensionError
+            self.rows[h_slice] = row
+            self.reset_cache()
+            return
+        raise TypeError
+
+    def __iter__(self):
+        return (row.tolist() for row in self.rows)
+
+    def __iadd__(self, other):
+        """ Add matrix with equal sizes """
+        if not isinstance(other, Matrix):
+            # let other operand (e.g. sparse matrix) handle it
+            return NotImplemented
+
+        if self.size != other.size:
+            raise DimensionError
+
+        other = as_array(other)
+        if self.is_int_add(other):
+            bound = max_abs(self.rows) + max_abs(other)
+            self.rows = self.int_result(np.add, other, bound)
+        else:
+            self.rows += other
+        self.reset_cache()
+        return self
+
+    def __isub__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+
+        if self.size != other.size:
+            raise DimensionError
+
+        other = as_array(other)
+        if self.is_int_add(other):
+            bound = max_abs(self.rows) + max_abs(other)
+            self.rows = self.int_result(np.subtract, other, bound)
+        else:
+            self.rows -= other
+        self.reset_cache()
+        return self
+
+    def is_int_add(self, other):
+        """ True, if int array other is added to int matrix, so overflow
+        must be checked (int matrix and float array raise TypeError) """
+        return self.dtype not in FLOAT_DTYPES and other.dtype.kind in 'iu'
+
+    def int_result(self, operation, other, bound):
+        """ Calculate operation(rows, other) of int matrix without overflow.
+
+        Args:
+            operation(Callable): NumPy function of two arguments
+            other(np.ndarray or int): second argument
+            bound(int): the biggest possible absolute value of result
+
+        Returns:
+            np.ndarray: result of dtype of matrix
+
+        Raises:
+            OverflowError: if item is out of range of dtype of matrix.
+
+        """
+        work_dtype = int_work_dtype(bound)
+        if isinstance(other, np.ndarray):
+            other = other.astype(work_dtype)
+        result = operation(self.rows.astype(work_dtype), other)
+        return to_int_dtype(result, self.dtype)
+
+    def __eq__(self, other):
+        """ Compare matrix. Two matrix is equal if equal each item's pair """
+        return self.size == other.size and \
+            np.array_equal(self.rows, as_array(other))
+
+    def __imul__(self, other):
+        if not isinstance(other, Real):
+            raise TypeError('You can mul only Matrix to Matrix')
+
+        if self.dtype not in FLOAT_DTYPES and isinstance(other, Integral):
+            bound = max(max_abs(self.rows) * abs(other), abs(other))
+            self.rows = self.int_result(np.multiply, other, bound)
+        else:
+            self.rows *= other
+        self.reset_cache()
+        return self
+
+    def __imatmul__(self, other):
+        """ Mul first matrix on second matrix by math rules. """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+
+        if self.count_cols != other.count_rows:
+            raise DimensionError
+
+        if self.dtype in FLOAT_DTYPES:
+            result = self.rows @ as_array(other)
+            self.rows = result.astype(self.dtype, casting='same_kind')
+        elif other.dtype in FLOAT_DTYPES:
+            raise TypeError('Result of matmul on floats is not int')
+        else:
+            self.rows = int_matmul(self.rows, as_array(other), self.dtype)
+        self.count_cols = other.count_cols
+        self.reset_cache()
+        return self
+
+    def __ipow__(self, other):
+        """ Mul matrix on itself other times """
+        if not isinstance(other, Integral):
+            raise TypeError
+
+        if other < 0:
+            raise ValueError("Power can't be negative.")
+
+        if self.count_rows != self.count_cols:
+            raise DimensionError
+
+        if self.dtype in FLOAT_DTYPES:
+            self.rows = np.linalg.matrix_power(self.rows, other)
+        else:
+            # exponentiation by squaring with check of overflow
+            result = np.eye(self.count_rows, dtype=self.dtype)
+            square = self.rows
+            while other:
+                if other & 1:
+                    result = int_matmul(result, square, self.dtype)
+                other >>= 1
+                if other:
+                    square = int_matmul(square, square, self.dtype)
+            self.rows = result
+        self.reset_cache()
+        return self
@@ -0,0 +1,104 @@
+import os
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import skipIf
+
+from . import problem_3_tests
+from .problem_3 import DimensionError, Matrix
+
+try:
+    from .numpy_matrix import NumpyMatrix
+except ImportError:  # numpy is not installed
+    NumpyMatrix = None
+
+
+@skipIf(NumpyMatrix is None, 'numpy is not installed')
+class TestNumpyMatrix(problem_3_tests.TestMatrix):
+    """ All tests of Matrix for NumpyMatrix """
+
+    def matrix(self, key):
+        return NumpyMatrix(self.inputs[key])
+
+    def random_pair(self, count_rows, count_cols):
+        random = Random(count_rows * count_cols)
+        rows = [
+            [random.randint(-100, 100) / 4 for _ in range(count_cols)]
+            for _ in range(count_rows)
+        ]
+        return Matrix(rows), NumpyMatrix(rows)
+
+    def test_same_as_matrix(self):
+        m1, n1 = self.random_pair(20, 30)
+        m2, n2 = self.random_pair(20, 30)
+        m3, n3 = self.random_pair(30, 10)
+
+        self.assertListEqual(list(n1 + n2), list(m1 + m2))
+        self.assertListEqual(list(n1 - n2), list(m1 - m2))
+        self.assertListEqual(list(n1 * 2), list(m1 * 2))
+        self.assertListEqual(list(n1.T), list(m1.T))
+        self.assertListEqual(list(n1[2:5, ::-3]), list(m1[2:5, ::-3]))
+        self.assertListEqual(list(n1 @ n3), list(m1 @ m3))
+        self.assertEqual(n1[3, 4], m1[3, 4])
+        self.assertEqual(n1, m1)
+        self.assertEqual(repr(n1), repr(m1))
+
+    def test_mixed(self):
+        m1, n1 = self.random_pair(4, 4)
+        self.assertListEqual(list(n1 + m1), list(m1 * 2))
+        self.assertListEqual(list(n1 @ m1), list(m1 @ m1))
+
+    def test_view_not_copied(self):
+        m, n = self.random_pair(6, 6)
+        v = m[1:5, ::2]
+        self.assertListEqual(list(NumpyMatrix(v)), list(v))
+        self.assertEqual(n[1:5, ::2], v)
+        self.assertListEqual(list(n[1:5, ::2] + v), list(v * 2))
+        self.assertFalse(v.is_copied)
+        m[1, 0] = 1000
+        self.assertEqual(v[0, 0], 1000)
+
+    def test_result_class(self):
+        n = NumpyMatrix([(2, 1), (1, 2)])
+        self.assertIsInstance(n.power(3, eigen=True), NumpyMatrix)
+        self.assertEqual(n.power(3, eigen=True), n ** 3)
+        for result in (*n.lu(), n.inv(), n.solve(n)):
+            self.assertIsInstance(result, NumpyMatrix)
+        self.assertEqual(n.solve(NumpyMatrix([[], []])).size, (2, 0))
+
+    def test_init_numpy(self):
+        import numpy as np
+
+        n = NumpyMatrix(np.arange(6).reshape(2, 3))
+        self.assertTupleEqual(n.size, (2, 3))
+        self.assertListEqual(list(n), [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+
+        with self.assertRaises(DimensionError):
+            NumpyMatrix(np.arange(6))
+
+    def test_binary_format(self):
+        m, n = self.random_pair(6, 4)
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'matrix.bin')
+            m.save(path)
+            self.assertEqual(NumpyMatrix.load(path), m)
+            mapped = NumpyMatrix.open_mmap(path)
+            self.assertEqual(mapped, m)
+            self.assertListEqual(list(mapped[1:4, ::2]), list(m[1:4, ::2]))
+            del mapped
+
+            n.save(path)
+            self.assertEqual(Matrix.load(path), m)
+
+
+@skipIf(NumpyMatrix is None, 'numpy is not installed')
+class TestNumpyDtype(problem_3_tests.TestDtype):
+    """ All tests of dtype of Matrix for NumpyMatrix """
+
+    def matrix(self, rows, dtype=None):
+        return NumpyMatrix(rows, dtype=dtype)
+
+    def test_numpy_dtype(self):
+        for dtype in ('f', 'd', 'i', 'q'):
+            m = self.matrix(self.rows, dtype)
+            self.assertEqual(m.rows.dtype.char, dtype)
+            self.assertEqual((m @ m.T).rows.dtype.char, dtype)
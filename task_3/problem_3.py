@@ -1,6 +1,45 @@
+import math
+import mmap
+import os
+import struct
+import sys
 from array import array
-from collections import Iterable
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from numbers import Integral, Real
+from operator import add, mul, sub
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, it's used only for BLAS matmul
+    np = None
+
+# types of items (typecodes of array): float32, float64, int32, int64
+DTYPES = ('f', 'd', 'i', 'q')
+FLOAT_DTYPES = ('f', 'd')
+DEFAULT_DTYPE = 'f'
+
+# count of columns of right matrix, which are multiplied at once
+MATMUL_BLOCK_SIZE = 64
+# min count of multiplications in matmul to use BLAS (if numpy is installed)
+BLAS_THRESHOLD = 200 ** 3
+# min count of multiplications in matmul to use pool of processes (if
+# BLAS isn't used)
+PARALLEL_THRESHOLD = 300 ** 3
+# max condition number of eigenvectors to use eigendecomposition in power
+EIGEN_MAX_COND = 1e8
+
+# matrices with more items are printed summarized: only REPR_EDGE_ITEMS
+# first and last rows and cols are shown (like in NumPy)
+REPR_THRESHOLD = 1000
+REPR_EDGE_ITEMS = 3
+
+# binary format of matrix: header, then items row by row in little-endian
+# header: magic, version, typecode of items, count rows, count cols
+MAGIC = b'MTRX'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sBc2xQQ')
 
 
 class DimensionError(ValueError):
@@ -8,6 +47,40 @@ class DimensionError(ValueError):
     pass
 
 
+class SingularMatrixError(ValueError):
+    """ Error raised when matrix is singular (it has no inverse) """
+    pass
+
+
+def check_dtype(dtype):
+    """ Raise ValueError if dtype isn't supported """
+    if dtype not in DTYPES:
+        raise ValueError(f'dtype must be one of {DTYPES}, not {dtype!r}')
+
+
+def result_dtype(dtype, other_dtype):
+    """ Return dtype of result of operation on items of two dtypes: the
+    same dtype for equal ones, else int64 for ints and float64 for others
+    """
+    if dtype == other_dtype:
+        return dtype
+    if dtype not in FLOAT_DTYPES and other_dtype not in FLOAT_DTYPES:
+        return 'q'
+    return 'd'
+
+
+def scale_dtype(dtype, number):
+    """ Return dtype of result of multiplication of items on number """
+    if dtype in FLOAT_DTYPES or isinstance(number, Integral):
+        return dtype
+    return 'd'
+
+
+def float_dtype(dtype):
+    """ Return dtype for not integer results (e.g. of inverse matrix) """
+    return dtype if dtype in FLOAT_DTYPES else 'd'
+
+
 def split_2d_slice(item):
     """ Function to split 2d slice
 
@@ -28,19 +101,360 @@ def split_2d_slice(item):
     return item, None
 
 
+def index_range(indexes, index):
+    """ Return part of range of indexes, selected by index.
+
+    Args:
+        indexes(range): range of indexes
+        index(int or slice or None): int, slice or None (whole range)
+
+    Returns:
+        range: selected indexes, int index gives range with one item
+
+    """
+    if index is None:
+        return indexes
+    if isinstance(index, Integral):
+        index = indexes[index]
+        return range(index, index + 1)
+    return indexes[index]
+
+
+def compose_ranges(outer, inner):
+    """ Return range of outer[i] for every i in inner (inner is not empty) """
+    start = outer[inner.start]
+    step = outer.step * inner.step
+    return range(start, start + step * len(inner), step)
+
+
+def range_to_slice(indexes):
+    """ Convert range to slice, which selects the same indexes """
+    stop = indexes.stop
+    if stop < 0:
+        stop = None
+    return slice(indexes.start, stop, indexes.step)
+
+
+if hasattr(math, 'sumprod'):  # python 3.12+
+    dot = math.sumprod
+else:
+    def dot(row, col):
+        """ Return sum of products of items of two sequences """
+        return sum(map(mul, row, col))
+
+
+def blocked_matmul(rows, other_rows, block_size=MATMUL_BLOCK_SIZE,
+                   dtype=DEFAULT_DTYPE):
+    """ Multiply matrices, given by rows, in pure python.
+
+    Right matrix is transposed once, so every item of result is a dot
+    product of two sequences. Columns are processed by blocks, so block
+    is reused for all rows of left matrix.
+
+    Args:
+        rows(List[array]): rows of left matrix
+        other_rows(List[array]): rows of right matrix
+        block_size(int): count of columns in block
+        dtype(str): typecode of items of result
+
+    Returns:
+        List[array]: rows of result matrix
+
+    """
+    columns = list(zip(*other_rows))
+    count_cols = len(columns)
+    row_size = array(dtype).itemsize * count_cols
+    result = [array(dtype, bytes(row_size)) for _ in rows]
+
+    for start in range(0, count_cols, block_size):
+        block = columns[start:start + block_size]
+        stop = start + len(block)
+        for row, result_row in zip(rows, result):
+            products = [dot(row, col) for col in block]
+            result_row[start:stop] = array(dtype, products)
+
+    return result
+
+
+def blas_matmul(rows, other_rows, dtype=DEFAULT_DTYPE):
+    """ Multiply matrices, given by rows, by NumPy (BLAS).
+
+    Floats are multiplied in double precision, ints in int64 (or in
+    python ints, if int64 can overflow), then they are converted to dtype.
+
+    Args:
+        rows(List[array]): rows of left matrix
+        other_rows(List[array]): rows of right matrix
+        dtype(str): typecode of items of result
+
+    Returns:
+        List[array]: rows of result matrix
+
+    Raises:
+        OverflowError: if int item of result is out of range of dtype,
+            like in pure python matmul.
+
+    """
+    if dtype in FLOAT_DTYPES:
+        result = np.array(rows, dtype=np.float64) @ \
+            np.array(other_rows, dtype=np.float64)
+        return [array(dtype, row.tobytes()) for row in result.astype(dtype)]
+
+    result = int_matmul(np.array(rows, dtype=np.int64),
+                        np.array(other_rows, dtype=np.int64), dtype)
+    return [array(dtype, row.tobytes()) for row in result]
+
+
+def max_abs(data):
+    """ Return the biggest absolute value of items of NumPy array as int """
+    if not data.size:
+        return 0
+    return max(abs(int(data.min())), abs(int(data.max())))
+
+
+def int_work_dtype(bound):
+    """ Return NumPy dtype to calculate ints, which absolute values are
+    not bigger than bound: int64 or python ints (object) """
+    return np.int64 if bound <= np.iinfo(np.int64).max else object
+
+
+def to_int_dtype(result, dtype):
+    """ Convert NumPy array of ints to dtype.
+
+    NumPy doesn't check overflow, so items are checked before conversion.
+
+    Args:
+        result(np.ndarray): ints in int64 or python ints
+        dtype(str): typecode of int items of result
+
+    Returns:
+        np.ndarray: array of dtype
+
+    Raises:
+        OverflowError: if item is out of range of dtype, like in array.
+
+    """
+    limits = np.iinfo(dtype)
+    if result.size and (result.min() < limits.min or
+                        result.max() > limits.max):
+        raise OverflowError('Item of result is out of range of dtype')
+    return result.astype(dtype)
+
+
+def int_matmul(left, right, dtype):
+    """ Multiply 2d NumPy arrays of ints without overflow.
+
+    Args:
+        left(np.ndarray): left matrix
+        right(np.ndarray): right matrix
+        dtype(str): typecode of int items of result
+
+    Returns:
+        np.ndarray: result of dtype
+
+    """
+    # the biggest possible item of result
+    work_dtype = int_work_dtype(max_abs(left) * max_abs(right) *
+                                left.shape[1])
+    result = left.astype(work_dtype) @ right.astype(work_dtype)
+    return to_int_dtype(result, dtype)
+
+
+def shared_rows(rows, count_cols, dtype):
+    """ Copy rows of numbers to new shared memory block """
+    row_size = array(dtype).itemsize * count_cols
+    shared = SharedMemory(create=True, size=row_size * len(rows) or 1)
+    for num_row, row in enumerate(rows):
+        offset = num_row * row_size
+        shared.buf[offset:offset + row_size] = array(dtype, row).tobytes()
+    return shared
+
+
+def read_rows(shared, start, stop, count_cols, dtype):
+    """ Read rows start..stop from shared memory block """
+    data = array(dtype)
+    row_size = data.itemsize * count_cols
+    data.frombytes(shared.buf[start * row_size:stop * row_size])
+    return [
+        data[num_row * count_cols:(num_row + 1) * count_cols]
+        for num_row in range(stop - start)
+    ]
+
+
+def matmul_shared(names, size, start, stop, dtype):
+    """ Multiply rows start..stop of left matrix on right matrix. Matrices
+    are read from shared memory and rows of result are written to it.
+    Runs in worker processes.
+
+    Args:
+        names(Tuple[str]): names of shared memory of left, right and result
+        size(Tuple[int]): count rows of right matrix and count cols of
+            right matrix
+        start(int): first row of left matrix
+        stop(int): row after last row of left matrix
+        dtype(str): typecode of items of matrices
+
+    Returns:
+        NoneType: return nothing
+
+    """
+    count_inner, count_cols = size
+    left, right, result = (SharedMemory(name=name) for name in names)
+    try:
+        rows = read_rows(left, start, stop, count_inner, dtype)
+        other_rows = read_rows(right, 0, count_inner, count_cols, dtype)
+        tmp_rows = blocked_matmul(rows, other_rows, dtype=dtype)
+
+        row_size = array(dtype).itemsize * count_cols
+        for num_row, row in enumerate(tmp_rows, start):
+            offset = num_row * row_size
+            result.buf[offset:offset + row_size] = row.tobytes()
+    finally:
+        for shared in left, right, result:
+            shared.close()
+
+
+def parallel_matmul(rows, other_rows, workers=None, dtype=DEFAULT_DTYPE):
+    """ Multiply matrices, given by rows, in pool of processes.
+
+    Rows of result are split between processes. Matrices are passed to
+    processes through shared memory, so they aren't pickled.
+
+    Args:
+        rows(List[array]): rows of left matrix
+        other_rows(List[array]): rows of right matrix
+        workers(int): count of processes, by default count of CPUs
+        dtype(str): typecode of items of result
+
+    Returns:
+        List[array]: rows of result matrix
+
+    """
+    count_rows, count_inner = len(rows), len(other_rows)
+    count_cols = len(other_rows[0]) if other_rows else 0
+    if not count_rows:
+        return []
+
+    tasks = min(workers or os.cpu_count() or 1, count_rows)
+    bounds = [count_rows * num_task // tasks for num_task in range(tasks + 1)]
+
+    result_size = array(dtype).itemsize * count_rows * count_cols
+    shared = [
+        shared_rows(rows, count_inner, dtype),
+        shared_rows(other_rows, count_cols, dtype),
+        SharedMemory(create=True, size=result_size or 1),
+    ]
+    try:
+        names = tuple(block.name for block in shared)
+        with ProcessPoolExecutor(max_workers=tasks) as executor:
+            futures = [
+                executor.submit(matmul_shared, names,
+                                (count_inner, count_cols), start, stop, dtype)
+                for start, stop in zip(bounds, bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+        return read_rows(shared[2], 0, count_rows, count_cols, dtype)
+    finally:
+        for block in shared:
+            block.close()
+            block.unlink()
+
+
+def write_header(file, typecode, count_rows, count_cols):
+    """ Write header of binary format of matrix to binary file """
+    file.write(HEADER.pack(MAGIC, FORMAT_VERSION, typecode.encode(),
+                           count_rows, count_cols))
+
+
+def read_header(file):
+    """ Read and check header of binary format of matrix.
+
+    Args:
+        file: readable binary file-like object
+
+    Returns:
+        1) str: typecode of items
+        2) int: count rows
+        3) int: count cols
+
+    """
+    header = file.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise ValueError('File is too short for matrix header')
+
+    magic, version, typecode, count_rows, count_cols = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError('File is not a matrix')
+    if version != FORMAT_VERSION:
+        raise ValueError(f'Unsupported version of matrix format: {version}')
+    typecode = typecode.decode()
+    if typecode not in DTYPES:
+        raise ValueError(f'Unsupported typecode of items: {typecode}')
+    return typecode, count_rows, count_cols
+
+
+class MappedRows(Sequence):
+    """ Rows of matrix, which items are in memory-mapped file.
+
+    Row is a memoryview of file, so rows are read from disk only when
+    their items are used.
+    """
+
+    def __init__(self, mapped, count_rows, count_cols, dtype=DEFAULT_DTYPE):
+        """ Init function.
+
+        Args:
+            mapped(mmap): mapped file in binary format of matrix
+            count_rows(int): count rows
+            count_cols(int): count cols
+            dtype(str): typecode of items
+
+        Returns:
+            NoneType: return nothing
+
+        """
+        self.mapped = mapped
+        self.dtype = dtype
+        self.data = memoryview(mapped)[HEADER.size:].cast(dtype)
+        self.count_rows, self.count_cols = count_rows, count_cols
+
+    def __len__(self):
+        return self.count_rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[num_row] for num_row in range(len(self))[index]]
+
+        num_row = range(self.count_rows)[index]
+        start = num_row * self.count_cols
+        return self.data[start:start + self.count_cols]
+
+    def __setitem__(self, index, row):
+        """ Write row to file (file must be mapped for writing) """
+        row = array(self.dtype, row)
+        if len(row) != self.count_cols:
+            raise DimensionError
+        self[index][:] = row
+
+
 class Matrix:
     """ Matrix class. Support many matrix-operations """
     rows = None
     count_rows, count_cols = 0, 0  # count rows and cols
     precision = 1  # precision for output
+    dtype = DEFAULT_DTYPE  # typecode of items
 
-    def __init__(self, iterable=None, precision=1):
+    def __init__(self, iterable=None, precision=1, dtype=None):
         """ Init function which create matrix from args.
 
         Args:
             iterable(Iterable): iter of iterable objects, every object must
                 be number (float or int)
             precision(int): precision for printing.
+            dtype(str): typecode of items: 'f' (float32), 'd' (float64),
+                'i' (int32) or 'q' (int64). By default dtype of iterable,
+                if it's Matrix, else 'f'. Int dtypes don't accept floats.
 
         Returns:
             NoneType: return nothing
@@ -48,7 +462,15 @@ class Matrix:
         """
 
         self.precision = precision
-        rows = [array('f', row) for row in iterable] if iterable else []
+        if dtype is None:
+            dtype = iterable.dtype if isinstance(iterable, Matrix) else \
+                DEFAULT_DTYPE
+        check_dtype(dtype)
+        self.dtype = dtype
+        # results of calculations (e.g. decompositions), which are reset
+        # when matrix is changed
+        self.cache = {}
+        rows = [array(dtype, row) for row in iterable] if iterable else []
 
         self.count_rows = len(rows)
         self.count_cols = max(map(len, rows), default=0)
@@ -62,8 +484,28 @@ class Matrix:
         if self.count_cols != min(map(len, self.rows), default=0):
             raise DimensionError
 
+    def reset_cache(self):
+        """ Remove cached results of calculations. Must be called by every
+        method, which changes items of matrix """
+        self.cache.clear()
+
+    @property
+    def result_class(self):
+        """ Class of new matrices, which are calculated from matrix """
+        return self.__class__
+
     def copy(self):
-        return Matrix(self)
+        return Matrix(self, dtype=self.dtype)
+
+    def astype(self, dtype):
+        """ Return copy of matrix with items of other dtype. Floats are
+        truncated to ints like by int() """
+        if dtype == self.dtype:
+            return self.copy()
+        if dtype in FLOAT_DTYPES or self.dtype not in FLOAT_DTYPES:
+            return Matrix(self, dtype=dtype)
+        return Matrix((map(int, row) for row in self.iter_rows()),
+                      dtype=dtype)
 
     @property
     def size(self):
@@ -78,43 +520,125 @@ class Matrix:
             Matrix: transposed matrix
         """
 
-        tmp = (
-            (
-                self.rows[num_row][num_col]
-                for num_row in range(self.count_rows)
-            )
-            for num_col in range(self.count_cols)
-        )
-        return Matrix(tmp)
+        return Matrix(zip(*self.iter_rows()), dtype=self.dtype)
 
     @classmethod
-    def zeros(cls, count_rows, count_cols):
+    def zeros(cls, count_rows, count_cols, dtype=DEFAULT_DTYPE):
         """ Create new Matrix count_rows*count_cols which contain from zeros
 
         Args:
             count_rows(int): count rows
             count_cols(int): count cols
+            dtype(str): typecode of items
 
         Returns:
             Matrix: matrix count_rows*count_cols from zeros
         """
 
         rows = ((0 for j in range(count_cols)) for i in range(count_rows))
-        return cls(rows)
+        return cls(rows, dtype=dtype)
 
     @classmethod
-    def even(cls, count_rows):
+    def even(cls, count_rows, dtype=DEFAULT_DTYPE):
         """ Create new diag Matrix n*n with 1 by diag and 0 whatever else.
 
         Args:
             count_rows(int): count rows and cols
+            dtype(str): typecode of items
 
         Returns:
             Matrix: E-matrix count_rows*count_cols
         """
 
         rows = ((i == j for j in range(count_rows)) for i in range(count_rows))
-        return cls(rows)
+        return cls(rows, dtype=dtype)
+
+    ##################################################
+    # Binary format
+    ##################################################
+
+    def save(self, path):
+        """ Save matrix to file in binary format.
+
+        Args:
+            path(str): path to file
+
+        Returns:
+            NoneType: return nothing
+
+        """
+        with open(path, 'wb') as file:
+            write_header(file, self.dtype, self.count_rows, self.count_cols)
+            for row in self.iter_rows():
+                row = array(self.dtype, row)
+                if sys.byteorder == 'big':
+                    row.byteswap()
+                file.write(row)
+
+    @classmethod
+    def load(cls, path):
+        """ Load matrix from file in binary format.
+
+        Args:
+            path(str): path to file
+
+        Returns:
+            Matrix: loaded matrix
+
+        """
+        with open(path, 'rb') as file:
+            dtype, count_rows, count_cols = read_header(file)
+            rows = []
+            for _ in range(count_rows):
+                row = array(dtype)
+                try:
+                    row.fromfile(file, count_cols)
+                except EOFError:
+                    raise ValueError('File is too short for matrix items')
+                if sys.byteorder == 'big':
+                    row.byteswap()
+                rows.append(row)
+
+        matrix = cls(dtype=dtype)
+        matrix.rows = rows
+        matrix.count_rows, matrix.count_cols = count_rows, count_cols
+        return matrix
+
+    @classmethod
+    def open_mmap(cls, path, writable=False):
+        """ Open file in binary format as memory-mapped matrix.
+
+        Items are not loaded to memory: rows are read from disk, when
+        they are used, so matrices bigger than memory can be iterated and
+        sliced. Operations, which create new matrix, load the result to
+        memory.
+
+        Args:
+            path(str): path to file
+            writable(bool): if True, changes of items (m[i, j] = x,
+                m[i] = [...], +=, -=, *=) are written to file.
+
+        Returns:
+            Matrix: matrix, which rows are MappedRows
+
+        """
+        if sys.byteorder == 'big':
+            # items in file are little-endian, they can't be mapped
+            return cls.load(path)
+
+        with open(path, 'r+b' if writable else 'rb') as file:
+            dtype, count_rows, count_cols = read_header(file)
+            item_size = array(dtype).itemsize
+            size = HEADER.size + item_size * count_rows * count_cols
+            if os.fstat(file.fileno()).st_size < size:
+                raise ValueError('File is too short for matrix items')
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            mapped = mmap.mmap(file.fileno(), size, access=access)
+
+        matrix = cls(dtype=dtype)
+        matrix.rows = MappedRows(mapped, count_rows, count_cols, dtype)
+        matrix.count_rows, matrix.count_cols = count_rows, count_cols
+        return matrix
 
     def __str__(self):
         text = f'[Matrix {self.count_rows}x{self.count_cols}]\n'
@@ -122,31 +646,60 @@ class Matrix:
         return text
 
     def __repr__(self):
-        def len_fmt(x):
-            return len(f'{x: ,.{self.precision}f}')
+        return self.to_string()
 
-        # calculate maximum len in each column.
-        max_len_in_col = []
-        for num_col in range(self.count_cols):
-            max_len = 0
-            for num_row in range(self.count_rows):
-                # calc len current cell and compare it with max_len
-                current_len = len_fmt(self.rows[num_row][num_col])
-                max_len = max(max_len, current_len + (num_col != 0))
+    def to_string(self, threshold=REPR_THRESHOLD, edge_items=REPR_EDGE_ITEMS):
+        """ Format items of matrix as table.
+
+        If count of items is more than threshold, only edge_items first and
+        last rows and cols are formatted, others are replaced by "...".
+
+        Args:
+            threshold(int): max count of items to format all items.
+            edge_items(int): count of shown rows (cols) at each edge.
 
-            max_len_in_col.append(max_len)
+        Returns:
+            str: formatted matrix
 
-        # create lines of matrix
+        """
+        def shown(count):
+            # indexes of shown rows (cols), None instead of skipped ones
+            if summarize and count > 2 * edge_items:
+                return [*range(edge_items), None,
+                        *range(count - edge_items, count)]
+            return range(count)
+
+        summarize = self.count_rows * self.count_cols > threshold
+        cols = shown(self.count_cols)
+        if self.dtype in FLOAT_DTYPES:
+            spec = f' #,.{self.precision}f'
+        else:
+            spec = ' ,d'
+
+        # every shown cell is formatted once, None is skipped row
         lines = []
-        for num_row in range(self.count_rows):
-            cells = []
-            for num_col in range(self.count_cols):
-                cell = self.rows[num_row][num_col]
-                width = max_len_in_col[num_col]
-                cells.append(f'{cell:> #{width},.{self.precision}f}')
-            lines.append(''.join(cells))
+        for num_row in shown(self.count_rows):
+            if num_row is None:
+                lines.append(None)
+                continue
+            lines.append([
+                '...' if num_col is None else
+                f'{self.cell(num_row, num_col):{spec}}'
+                for num_col in cols
+            ])
 
-        return '\n'.join(map(str.rstrip, lines))
+        # calculate maximum len in each column.
+        widths = [
+            max((len(line[i]) for line in lines if line is not None),
+                default=0) + (i != 0)
+            for i in range(len(cols))
+        ]
+
+        return '\n'.join(
+            ' ...' if line is None else
+            ''.join(map(str.rjust, line, widths)).rstrip()
+            for line in lines
+        )
 
     def __getitem__(self, item):
         # get horizontal and vertical slices
@@ -156,35 +709,38 @@ class Matrix:
                 (v_slice and not isinstance(v_slice, (Integral, slice))):
             raise TypeError('Slice must be int, slice, or tuple of them')
 
-        tmp_matrix = list(self)
+        # If need return one number
+        if isinstance(h_slice, Integral) and isinstance(v_slice, Integral):
+            return self.cell(h_slice, v_slice)
 
-        # horizontal slice, if exists
-        if h_slice is not None:
-            if isinstance(h_slice, Integral):
-                tmp_matrix = (tmp_matrix[h_slice],)
-            else:
-                tmp_matrix = tmp_matrix[h_slice]
+        rows = index_range(range(self.count_rows), h_slice)
+        cols = index_range(range(self.count_cols), v_slice)
+        if not rows or not cols:
+            return None
 
-        # vertical slice, if exists
-        if (v_slice is not None) and tmp_matrix:
-            if isinstance(v_slice, Integral):
-                tmp_matrix = ((row[v_slice],) for row in tmp_matrix)
-            else:
-                tmp_matrix = (row[v_slice] for row in tmp_matrix)
+        return self.view(rows, cols)
 
-        # create matrix from slice
-        matr = Matrix(tmp_matrix)
+    def cell(self, num_row, num_col):
+        """ Return item of matrix (indexes can be negative) """
+        return self.rows[num_row][num_col]
 
-        # If need return one number
-        if isinstance(h_slice, Integral) and isinstance(v_slice, Integral):
-            # if h_slice and v_slice is int, then matr is 1*1
-            # return M[0][0]
-            return matr.rows[0][0]
+    def view(self, rows, cols):
+        """ Create view of part of matrix (without copying).
 
-        if matr.count_rows == 0 or matr.count_cols == 0:
-            return None
+        Args:
+            rows(range): indexes of rows
+            cols(range): indexes of cols
+
+        Returns:
+            MatrixView: view of matrix
 
-        return matr
+        """
+        return MatrixView(self, rows, cols)
+
+    def iter_rows(self):
+        """ Iterate rows of matrix as sequences of numbers (without copying,
+        if it's possible) """
+        return iter(self.rows)
 
     def __setitem__(self, key, value):
         h_slice, v_slice = split_2d_slice(key)
@@ -193,24 +749,29 @@ class Matrix:
                 and isinstance(v_slice, Integral):
             # if setting M[i][j] = float
             self.rows[h_slice][v_slice] = value
+            self.reset_cache()
             return
         if isinstance(value, Iterable) and isinstance(h_slice, Integral) \
                 and v_slice is None:
             # if setting M[i] = [...]
-            self.rows[h_slice] = array('f', value)
+            self.rows[h_slice] = array(self.dtype, value)
             self.check_matrix_dimension()
+            self.reset_cache()
             return
         raise TypeError
 
     def __iter__(self):
-        return (list(row) for row in self.rows)
+        return (list(row) for row in self.iter_rows())
 
     ##################################################
     # Add methods
     ##################################################
 
     def __add__(self, other):
-        tmp_matrix = self.copy()
+        if not isinstance(other, Matrix):
+            # let other operand (e.g. lazy expression) handle it
+            return NotImplemented
+        tmp_matrix = self.astype(result_dtype(self.dtype, other.dtype))
         tmp_matrix += other
         return tmp_matrix
 
@@ -220,15 +781,16 @@ class Matrix:
     def __iadd__(self, other):
         """ Add matrix with equal sizes """
         if not isinstance(other, Matrix):
-            raise TypeError('You can add/sub only Matrix to Matrix')
+            # let other operand (e.g. sparse matrix) handle it
+            return NotImplemented
 
         if self.size != other.size:
             raise DimensionError
 
-        for num_row in range(self.count_rows):
-            for num_col in range(self.count_cols):
-                self.rows[num_row][num_col] += other.rows[num_row][num_col]
+        for row, other_row in zip(self.rows, other.iter_rows()):
+            row[:] = array(self.dtype, map(add, row, other_row))
 
+        self.reset_cache()
         return self
 
     ##################################################
@@ -247,7 +809,9 @@ class Matrix:
     ##################################################
 
     def __sub__(self, other):
-        tmp_matrix = self.copy()
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        tmp_matrix = self.astype(result_dtype(self.dtype, other.dtype))
         tmp_matrix -= other
         return tmp_matrix
 
@@ -264,9 +828,9 @@ class Matrix:
 
     def __eq__(self, other):
         """ Compare matrix. Two matrix is equal if equal each item's pair """
-        return all(
-            self.rows[row_num] == other.rows[row_num]
-            for row_num in range(self.count_rows)
+        return self.size == other.size and all(
+            row == other_row
+            for row, other_row in zip(self.iter_rows(), other.iter_rows())
         )
 
     ##################################################
@@ -283,7 +847,7 @@ class Matrix:
             Matrix: return new Matrix
 
         """
-        tmp_matrix = self.copy()
+        tmp_matrix = self.astype(scale_dtype(self.dtype, other))
         tmp_matrix *= other
         return tmp_matrix
 
@@ -303,7 +867,9 @@ class Matrix:
         if not isinstance(other, Real):
             raise TypeError('You can mul only Matrix to Matrix')
 
-        self.rows = [[item * other for item in row] for row in self.rows]
+        for row in self.rows:
+            row[:] = array(self.dtype, [item * other for item in row])
+        self.reset_cache()
         return self
 
     ##################################################
@@ -311,33 +877,37 @@ class Matrix:
     ##################################################
 
     def __matmul__(self, other):
-        tmp_matrix = self.copy()
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        tmp_matrix = self.astype(result_dtype(self.dtype, other.dtype))
         tmp_matrix @= other
         return tmp_matrix
 
     def __imatmul__(self, other):
         """ Mul first matrix on second matrix by math rules. """
         if not isinstance(other, Matrix):
-            raise TypeError('You can matmul only Matrix to Matrix')
+            return NotImplemented
 
         if self.count_cols != other.count_rows:
             raise DimensionError
 
-        tmp_rows = [
-            array('f', [0] * other.count_cols)
-            for _ in range(self.count_rows)
-        ]
+        if self.dtype not in FLOAT_DTYPES and other.dtype in FLOAT_DTYPES:
+            raise TypeError('Result of matmul on floats is not int')
 
-        for i in range(self.count_rows):
-            for j in range(other.count_cols):
-                q = (
-                    self.rows[i][k] * other.rows[k][j]
-                    for k in range(self.count_cols)
-                )
-                tmp_rows[i][j] = sum(q)
+        other_rows = list(other.iter_rows())
+        count_mul = self.count_rows * self.count_cols * other.count_cols
+        if np is not None and count_mul >= BLAS_THRESHOLD:
+            tmp_rows = blas_matmul(self.rows, other_rows, self.dtype)
+        elif count_mul >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+            tmp_rows = parallel_matmul(self.rows, other_rows,
+                                       dtype=self.dtype)
+        else:
+            tmp_rows = blocked_matmul(self.rows, other_rows,
+                                      dtype=self.dtype)
 
         self.rows = tmp_rows
         self.count_cols = other.count_cols
+        self.reset_cache()
         return self
 
     ##################################################
@@ -361,12 +931,315 @@ class Matrix:
             raise DimensionError
 
         if other == 0:
-            q = Matrix.even(self.count_rows)
+            q = Matrix.even(self.count_rows, self.dtype)
             self.rows = q.rows
+            self.reset_cache()
 
         if other > 1:
-            q = self.copy()
-            for i in range(other - 1):
-                self @= q
+            # exponentiation by squaring: self ** 13 = self * self ** 4 *
+            # self ** 8, so only O(log(other)) matmuls are needed
+            square = self.copy()
+            result = None
+            while other:
+                if other & 1:
+                    result = square.copy() if result is None else \
+                        result @ square
+                other >>= 1
+                if other:
+                    square @= square
+
+            self.rows = result.rows
+            self.reset_cache()
 
         return self
+
+    def power(self, other, eigen=False):
+        """ Return matrix ** other.
+
+        If eigen, eigendecomposition M = V * diag(w) * V^-1 is calculated
+        once and cached, then M ** n = V * diag(w ** n) * V^-1 is calculated
+        without matmuls of matrix on itself. It needs numpy, float dtype and
+        diagonalizable matrix, otherwise exponentiation by squaring is used
+        (floats of decomposition can't give exact ints).
+
+        Args:
+            other(int): power, must be non-negative
+            eigen(bool): use eigendecomposition
+
+        Returns:
+            Matrix: new matrix
+
+        """
+        if not eigen or np is None or self.dtype not in FLOAT_DTYPES \
+                or not isinstance(other, Integral) or other < 0 \
+                or self.count_rows != self.count_cols:
+            return self ** other
+
+        decomposition = self.cache.get('eigen')
+        if decomposition is None:
+            values, vectors = np.linalg.eig(
+                np.array(list(self.iter_rows()), np.float64))
+            if np.linalg.cond(vectors) > EIGEN_MAX_COND:
+                # matrix is not diagonalizable
+                decomposition = False
+            else:
+                decomposition = values, vectors, np.linalg.inv(vectors)
+            self.cache['eigen'] = decomposition
+
+        if decomposition is False:
+            return self ** other
+
+        values, vectors, inverse = decomposition
+        result = ((vectors * values ** other) @ inverse).real
+        return self.result_class(result.tolist(), self.precision, self.dtype)
+
+    ##################################################
+    # Linear algebra
+    ##################################################
+
+    def lu_factor(self):
+        """ LU decomposition with partial pivoting: P * M = L * U.
+
+        Decomposition is calculated in double precision once and cached,
+        until matrix is changed.
+
+        Returns:
+            1) List[List[float]]: rows of L and U in one square matrix: L
+                is under the diagonal (its diagonal is ones), U is on and
+                over the diagonal
+            2) List[int]: permutation: row i of P * M is row
+                permutation[i] of M
+            3) int: sign of permutation (1 or -1)
+            4) bool: True, if matrix is singular
+
+        """
+        if self.count_rows != self.count_cols:
+            raise DimensionError
+
+        factorization = self.cache.get('lu')
+        if factorization is not None:
+            return factorization
+
+        size = self.count_rows
+        lu = [list(map(float, row)) for row in self.iter_rows()]
+        permutation = list(range(size))
+        sign, singular = 1, False
+
+        for k in range(size):
+            pivot = max(range(k, size), key=lambda i: abs(lu[i][k]))
+            if pivot != k:
+                lu[k], lu[pivot] = lu[pivot], lu[k]
+                permutation[k], permutation[pivot] = \
+                    permutation[pivot], permutation[k]
+                sign = -sign
+
+            pivot_row = lu[k]
+            if not pivot_row[k]:
+                singular = True
+                continue
+
+            tail = pivot_row[k + 1:]
+            for row in lu[k + 1:]:
+                factor = row[k] / pivot_row[k]
+                row[k] = factor
+                if factor:
+                    row[k + 1:] = map(sub, row[k + 1:],
+                                      map(factor.__mul__, tail))
+
+        factorization = lu, permutation, sign, singular
+        self.cache['lu'] = factorization
+        return factorization
+
+    def lu(self):
+        """ LU decomposition with partial pivoting.
+
+        Returns:
+            1) Matrix: permutation matrix P
+            2) Matrix: lower triangular matrix L with ones on diagonal
+            3) Matrix: upper triangular matrix U
+            so M = P @ L @ U
+
+        """
+        lu, permutation, _, _ = self.lu_factor()
+        size, dtype = self.count_rows, float_dtype(self.dtype)
+        p = self.result_class.zeros(size, size, dtype)
+        for num_col, num_row in enumerate(permutation):
+            p[num_row, num_col] = 1
+        lower = self.result_class((
+            row[:num_row] + [1] + [0] * (size - num_row - 1)
+            for num_row, row in enumerate(lu)
+        ), dtype=dtype)
+        upper = self.result_class((
+            [0] * num_row + row[num_row:] for num_row, row in enumerate(lu)
+        ), dtype=dtype)
+        return p, lower, upper
+
+    def det(self):
+        """ Return determinant of square matrix """
+        lu, _, sign, singular = self.lu_factor()
+        if singular:
+            return 0.0
+        return sign * math.prod((row[i] for i, row in enumerate(lu)),
+                                start=1.0)
+
+    def solve_vector(self, vector):
+        """ Solve M * x = vector by cached LU decomposition in O(n ** 2).
+
+        Args:
+            vector(Sequence[float]): right part, len must be count rows
+
+        Returns:
+            List[float]: x
+
+        """
+        lu, permutation, _, singular = self.lu_factor()
+        if singular:
+            raise SingularMatrixError
+        if len(vector) != self.count_rows:
+            raise DimensionError
+
+        # L * y = P * vector
+        y = []
+        for row, num_row in zip(lu, permutation):
+            y.append(vector[num_row] - dot(row[:len(y)], y))
+
+        # U * x = y
+        x = []
+        for num_row in reversed(range(self.count_rows)):
+            row = lu[num_row]
+            x.append((y[num_row] - dot(row[:num_row:-1], x)) / row[num_row])
+        x.reverse()
+        return x
+
+    def solve(self, b):
+        """ Solve linear system M @ x = b.
+
+        LU decomposition of M is cached, so after first solve every next
+        solve with the same matrix costs O(n ** 2) per column of b.
+
+        Args:
+            b(Matrix or Iterable[float]): right part: matrix with count
+                rows of M rows or vector
+
+        Returns:
+            Matrix or List[float]: x, matrix if b is matrix
+
+        """
+        if not isinstance(b, Matrix):
+            return self.solve_vector(list(map(float, b)))
+
+        if b.count_rows != self.count_rows:
+            raise DimensionError
+        dtype = float_dtype(result_dtype(self.dtype, b.dtype))
+        columns = [self.solve_vector(col) for col in zip(*b.iter_rows())]
+        if not columns:
+            return self.result_class([[]] * self.count_rows, self.precision,
+                                     dtype)
+        return self.result_class(zip(*columns), self.precision, dtype)
+
+    def inv(self):
+        """ Return inverse matrix """
+        return self.solve(self.result_class.even(self.count_rows, self.dtype))
+
+
+class MatrixView(Matrix):
+    """ View of part of matrix, which is returned by slicing.
+
+    View doesn't copy items: they are read from the matrix, so changes of
+    the matrix are visible in the view. When view is changed or its rows
+    are needed (e.g. in += or @), items are copied to the view and it
+    becomes independent matrix.
+
+    Example:
+        >> m = Matrix(((1, 2, 3), (4, 5, 6)))
+        >> v = m[:, 1:]  # nothing is copied
+        >> m[0, 1] = 0
+        >> v[0, 0]
+        0.0
+        >> v[0, 0] = 10  # items of v are copied, m isn't changed
+    """
+
+    def __init__(self, matrix, rows, cols):
+        """ Init function which create view of matrix.
+
+        Args:
+            matrix(Matrix): matrix, which items are viewed
+            rows(range): indexes of rows in matrix
+            cols(range): indexes of cols in matrix
+
+        Returns:
+            NoneType: return nothing
+
+        """
+        self.matrix = matrix
+        self.row_indexes, self.col_indexes = rows, cols
+        self.count_rows, self.count_cols = len(rows), len(cols)
+        self.precision = matrix.precision
+        self.dtype = matrix.dtype
+        self.cache = {}
+        self.copied_rows = None
+
+    @property
+    def cache(self):
+        """ Cache of view. Items of matrix can be changed without view,
+        so results are cached only after copying of items """
+        if self.copied_rows is None:
+            return {}
+        return self.copied_cache
+
+    @cache.setter
+    def cache(self, cache):
+        self.copied_cache = cache
+
+    @property
+    def is_copied(self):
+        """ True, if items are copied from matrix """
+        return self.copied_rows is not None
+
+    @property
+    def rows(self):
+        """ Rows of view. Items are copied from matrix on first access """
+        if self.copied_rows is None:
+            self.copied_rows = [
+                array(self.dtype, row) for row in self.iter_rows()
+            ]
+        return self.copied_rows
+
+    @rows.setter
+    def rows(self, rows):
+        self.copied_rows = rows
+
+    @property
+    def result_class(self):
+        """ Results of view are matrices of class of viewed matrix """
+        return self.matrix.result_class
+
+    def materialize(self):
+        """ Copy items of view to new Matrix """
+        return Matrix(self)
+
+    def cell(self, num_row, num_col):
+        if self.copied_rows is not None:
+            return super().cell(num_row, num_col)
+
+        num_row = self.row_indexes[num_row]
+        num_col = self.col_indexes[num_col]
+        return self.matrix.rows[num_row][num_col]
+
+    def view(self, rows, cols):
+        if self.copied_rows is not None:
+            return super().view(rows, cols)
+
+        return MatrixView(
+            self.matrix,
+            compose_ranges(self.row_indexes, rows),
+            compose_ranges(self.col_indexes, cols),
+        )
+
+    def iter_rows(self):
+        if self.copied_rows is not None:
+            return iter(self.copied_rows)
+
+        matrix_rows = self.matrix.rows
+        cols = range_to_slice(self.col_indexes)
+        return (matrix_rows[num_row][cols] for num_row in self.row_indexes)
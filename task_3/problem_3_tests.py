@@ -1,6 +1,29 @@
-from unittest import TestCase
+import os
+from array import array
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
 
-from .problem_3 import DimensionError, Matrix
+from .problem_3 import (
+    HEADER, MAGIC, DimensionError, MappedRows, Matrix, MatrixView,
+    SingularMatrixError, blas_matmul, blocked_matmul, np, parallel_matmul,
+)
+
+
+def random_matrix(count_rows, count_cols, seed=0):
+    random = Random(seed)
+    return Matrix(
+        [random.uniform(-10, 10) for _ in range(count_cols)]
+        for _ in range(count_rows)
+    )
+
+
+def naive_matmul(m1, m2):
+    return [
+        [sum(m1[i, k] * m2[k, j] for k in range(m1.count_cols))
+         for j in range(m2.count_cols)]
+        for i in range(m1.count_rows)
+    ]
 
 
 class TestMatrix(TestCase):
@@ -44,6 +67,23 @@ class TestMatrix(TestCase):
             " 4.0  5.0  6.0",
         )
 
+    def test_summarized_str(self):
+        m = Matrix(range(i, i + 8) for i in range(0, 80, 10))
+        self.assertEqual(
+            m.to_string(threshold=50, edge_items=2),
+            "  0.0   1.0 ...   6.0   7.0\n"
+            " 10.0  11.0 ...  16.0  17.0\n"
+            " ...\n"
+            " 60.0  61.0 ...  66.0  67.0\n"
+            " 70.0  71.0 ...  76.0  77.0",
+        )
+        self.assertEqual(m.to_string(threshold=64), repr(m))
+        self.assertNotIn('...', repr(m))
+
+        m = Matrix.zeros(2000, 2000)
+        self.assertEqual(len(repr(m).splitlines()), 7)
+        self.assertEqual(len(str(m[:3]).splitlines()), 4)
+
     def test_slice(self):
         m = self.matrix('simple')
         self.assertListEqual(
@@ -317,3 +357,479 @@ class TestMatrix(TestCase):
              [0.0, 1.0, 0.0],
              [0.0, 0.0, 1.0]]
         )
+
+
+class TestMatmul(TestCase):
+
+    def setUp(self):
+        self.m1 = random_matrix(13, 17, 1)
+        self.m2 = random_matrix(17, 11, 2)
+
+    def test_blocked(self):
+        out = Matrix(naive_matmul(self.m1, self.m2))
+        for block_size in (1, 4, 11, 64):
+            rows = blocked_matmul(self.m1.rows, self.m2.rows, block_size)
+            self.assertEqual(Matrix(rows), out)
+
+        self.assertEqual(self.m1 @ self.m2, out)
+
+    def test_empty(self):
+        self.assertListEqual(blocked_matmul([], []), [])
+        m = Matrix([[], []]) @ Matrix()
+        self.assertTupleEqual(m.size, (2, 0))
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_blas(self):
+        out = blocked_matmul(self.m1.rows, self.m2.rows)
+        rows = blas_matmul(self.m1.rows, self.m2.rows)
+        for row, out_row in zip(rows, out):
+            for item, out_item in zip(row, out_row):
+                self.assertAlmostEqual(item, out_item, places=3)
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_blas_overflow(self):
+        for dtype, item in (('i', 2 ** 20), ('q', 2 ** 40)):
+            rows = [array(dtype, [item] * 3)] * 3
+            with self.assertRaises(OverflowError):
+                blocked_matmul(rows, rows, dtype=dtype)
+            with self.assertRaises(OverflowError):
+                blas_matmul(rows, rows, dtype)
+
+        # int64 can overflow, result is calculated in python ints
+        rows = [array('q', [2 ** 40, 2 ** 40 + 1])]
+        other_rows = [array('q', [2 ** 30]), array('q', [-2 ** 30])]
+        self.assertListEqual(blas_matmul(rows, other_rows, 'q'),
+                             [array('q', [-2 ** 30])])
+
+        m = Matrix.even(250, 'i') * 2 ** 20
+        with self.assertRaises(OverflowError):
+            m @ m
+
+    def test_parallel(self):
+        out = blocked_matmul(self.m1.rows, self.m2.rows)
+        for workers in (1, 2, 5, 20):
+            rows = parallel_matmul(self.m1.rows, self.m2.rows, workers)
+            self.assertListEqual(rows, out)
+
+        self.assertListEqual(parallel_matmul([], []), [])
+
+        m1, m2 = self.m1.astype('q'), self.m2.astype('q')
+        out = blocked_matmul(m1.rows, m2.rows, dtype='q')
+        self.assertEqual(out[0].typecode, 'q')
+        self.assertListEqual(parallel_matmul(m1.rows, m2.rows, 3, 'q'), out)
+        if np is not None:
+            self.assertListEqual(blas_matmul(m1.rows, m2.rows, 'q'), out)
+
+
+class TestPower(TestCase):
+
+    def setUp(self):
+        # transition matrix of Markov chain
+        self.markov = Matrix([
+            (0.9, 0.075, 0.025),
+            (0.15, 0.8, 0.05),
+            (0.25, 0.25, 0.5),
+        ])
+
+    def assertMatrixAlmostEqual(self, m1, m2, places=4):
+        self.assertTupleEqual(m1.size, m2.size)
+        for row1, row2 in zip(m1, m2):
+            for item1, item2 in zip(row1, row2):
+                self.assertAlmostEqual(item1, item2, places=places)
+
+    def test_squaring(self):
+        m = random_matrix(4, 4, 3) * 0.1
+        for power in (1, 2, 3, 7, 8, 13):
+            # previous implementation: power - 1 matmuls
+            out = m.copy()
+            for _ in range(power - 1):
+                out @= m
+            self.assertMatrixAlmostEqual(m ** power, out)
+
+        self.assertEqual(m ** 0, Matrix.even(4))
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_eigen(self):
+        for power in (0, 1, 5, 100, 1000):
+            self.assertMatrixAlmostEqual(
+                self.markov.power(power, eigen=True),
+                self.markov ** power,
+            )
+        self.assertIn('eigen', self.markov.cache)
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_eigen_cache_reset(self):
+        self.markov.power(10, eigen=True)
+        self.markov[0, 0] = 1
+        self.assertNotIn('eigen', self.markov.cache)
+        self.assertMatrixAlmostEqual(
+            self.markov.power(10, eigen=True),
+            self.markov ** 10,
+        )
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_eigen_view(self):
+        m = Matrix([(2, 1, 0), (1, 2, 0), (0, 0, 1)])
+        v = m[:2, :2]
+        result = v.power(3, eigen=True)
+        self.assertIs(type(result), Matrix)
+        self.assertMatrixAlmostEqual(result, Matrix([(14, 13), (13, 14)]))
+        self.assertFalse(v.is_copied)
+
+    def test_eigen_int(self):
+        m = Matrix([(1, 1), (1, 0)], dtype='q')
+        self.assertEqual(m.power(80, eigen=True)[0, 0], 37889062373143906)
+        self.assertNotIn('eigen', m.cache)
+        with self.assertRaises(OverflowError):
+            m.power(100, eigen=True)
+
+    def test_not_diagonalizable(self):
+        m = Matrix([(1, 1), (0, 1)])
+        self.assertEqual(m.power(5, eigen=True), Matrix([(1, 5), (0, 1)]))
+
+    def test_power_raise(self):
+        with self.assertRaises(ValueError):
+            self.markov.power(-1, eigen=True)
+        with self.assertRaises(DimensionError):
+            Matrix([(1, 2)]).power(2, eigen=True)
+
+
+class TestMatrixView(TestCase):
+
+    def setUp(self):
+        self.m = Matrix(((1, 2, 3,), (4, 5, 6), (7, 8, 9), (10, 11, 12)))
+
+    def test_scalar(self):
+        m = random_matrix(50, 40)
+        for i, row in enumerate(m):
+            for j, item in enumerate(row):
+                self.assertEqual(m[i, j], item)
+        self.assertEqual(m[-1, -1], list(m)[-1][-1])
+
+        with self.assertRaises(IndexError):
+            m[50, 0]
+
+    def test_no_copy(self):
+        v = self.m[1:3, ::-1]
+        self.assertIsInstance(v, MatrixView)
+        self.assertFalse(v.is_copied)
+        self.assertTupleEqual(v.size, (2, 3))
+        self.assertListEqual(list(v), [[6.0, 5.0, 4.0], [9.0, 8.0, 7.0]])
+        self.assertEqual(v[0, 0], 6.0)
+        self.assertEqual(v[-1, -1], 7.0)
+        self.assertEqual(
+            str(v),
+            '[Matrix 2x3]\n 6.0  5.0  4.0\n 9.0  8.0  7.0',
+        )
+        self.assertEqual(v, Matrix([(6, 5, 4), (9, 8, 7)]))
+        self.assertEqual(v.T, Matrix([(6, 9), (5, 8), (4, 7)]))
+        self.assertEqual(v + v, Matrix([(12, 10, 8), (18, 16, 14)]))
+        self.assertFalse(v.is_copied)
+
+    def test_shared(self):
+        v = self.m[:, 1]
+        self.m[0, 1] = 0
+        self.assertEqual(v[0, 0], 0)
+        self.m += self.m
+        self.assertListEqual(list(v), [[0.0], [10.0], [16.0], [22.0]])
+
+    def test_copy_on_write(self):
+        v = self.m[::2, 1:]
+        v[0, 0] = 100
+        self.assertTrue(v.is_copied)
+        self.assertListEqual(list(v), [[100.0, 3.0], [8.0, 9.0]])
+        self.assertEqual(self.m[0, 1], 2.0)
+
+        v = self.m[1:3]
+        v *= 2
+        self.assertListEqual(list(v), [[8.0, 10.0, 12.0], [14.0, 16.0, 18.0]])
+        self.assertListEqual(list(self.m[1]), [[4.0, 5.0, 6.0]])
+
+    def test_view_of_view(self):
+        v = self.m[::-1, ::2][1:, 1]
+        self.assertListEqual(list(v), [[9.0], [6.0], [3.0]])
+        self.assertIs(v.matrix, self.m)
+        self.assertIsNone(self.m[::-1, ::2][1:1])
+
+    def test_materialize(self):
+        v = self.m[2:, :2]
+        m = v.materialize()
+        self.assertNotIsInstance(m, MatrixView)
+        self.assertEqual(m, v)
+        self.m[2, 0] = 0
+        self.assertNotEqual(m, v)
+
+    def test_matmul(self):
+        v = self.m[:2, :2]
+        self.assertEqual(v @ v, Matrix([(9, 12), (24, 33)]))
+        self.assertEqual(self.m[:2] @ self.m[:3, :1], Matrix([(30,), (66,)]))
+
+
+class TestLinearAlgebra(TestCase):
+
+    def setUp(self):
+        self.m = Matrix([(2, 1, 1), (4, -6, 0), (-2, 7, 2)])
+
+    def assertMatrixAlmostEqual(self, m1, m2, places=4):
+        self.assertTupleEqual(m1.size, m2.size)
+        for row, other_row in zip(m1, m2):
+            for item, other_item in zip(row, other_row):
+                self.assertAlmostEqual(item, other_item, places=places)
+
+    def test_lu(self):
+        p, lower, upper = self.m.lu()
+        self.assertEqual(p @ lower @ upper, self.m)
+        for num_row in range(3):
+            self.assertEqual(lower[num_row, num_row], 1)
+            for num_col in range(num_row + 1, 3):
+                self.assertEqual(lower[num_row, num_col], 0)
+                self.assertEqual(upper[num_col, num_row], 0)
+        # partial pivoting: the biggest item of first column is pivot
+        self.assertEqual(upper[0, 0], 4)
+
+    def test_det(self):
+        self.assertAlmostEqual(self.m.det(), -16)
+        self.assertEqual(Matrix([(0, 1), (1, 0)]).det(), -1)
+        self.assertEqual(Matrix([(1, 2), (2, 4)]).det(), 0)
+        self.assertEqual(Matrix.even(5).det(), 1)
+        self.assertEqual(Matrix().det(), 1)
+
+        m = random_matrix(8, 8, 1)
+        self.assertAlmostEqual((m @ m).det() / m.det() ** 2, 1, places=4)
+
+        with self.assertRaises(DimensionError):
+            Matrix([(1, 2, 3)]).det()
+
+    def test_solve(self):
+        x = self.m.solve([5, -2, 9])
+        self.assertIsInstance(x, list)
+        for item, expected in zip(x, (1, 1, 2)):
+            self.assertAlmostEqual(item, expected)
+
+        b = Matrix([(5, 1), (-2, 2), (9, 3)])
+        x = self.m.solve(b)
+        self.assertIsInstance(x, Matrix)
+        self.assertMatrixAlmostEqual(self.m @ x, b)
+
+        with self.assertRaises(DimensionError):
+            self.m.solve([1, 2])
+        with self.assertRaises(DimensionError):
+            self.m.solve(Matrix([(1, 2)]))
+        with self.assertRaises(SingularMatrixError):
+            Matrix([(1, 2), (2, 4)]).solve([1, 1])
+
+    def test_inv(self):
+        m = random_matrix(10, 10, 2)
+        self.assertMatrixAlmostEqual(m @ m.inv(), Matrix.even(10))
+        self.assertMatrixAlmostEqual(self.m.inv().inv(), self.m)
+
+        with self.assertRaises(SingularMatrixError):
+            Matrix.zeros(3, 3).inv()
+
+    def test_cache(self):
+        factorization = self.m.lu_factor()
+        self.assertIs(self.m.lu_factor(), factorization)
+        self.m.solve([1, 2, 3])
+        self.assertIs(self.m.lu_factor(), factorization)
+
+        self.m[0, 0] = 0
+        self.assertIsNot(self.m.lu_factor(), factorization)
+        self.assertAlmostEqual(self.m.det(), 8)
+
+        self.m[2] = [0, 0, 1]
+        self.assertAlmostEqual(self.m.det(), -4)
+        self.m *= 2
+        self.assertAlmostEqual(self.m.det(), -32)
+
+    def test_view(self):
+        v = self.m[1:, 1:]
+        self.assertAlmostEqual(v.det(), -12)
+        self.m[1, 1] = 1
+        self.assertAlmostEqual(v.det(), 2)
+        for result in (*v.lu(), v.inv(), v.solve(v)):
+            self.assertIs(type(result), Matrix)
+
+
+class TestDtype(TestCase):
+
+    def matrix(self, rows, dtype=None):
+        return Matrix(rows, dtype=dtype)
+
+    def setUp(self):
+        self.rows = ((1, 2, 3), (4, 5, 6))
+
+    def assertDtype(self, m, dtype):
+        self.assertEqual(m.dtype, dtype)
+        for row in m:
+            for item in row:
+                self.assertIsInstance(item, float if dtype in 'fd' else int)
+
+    def test_init(self):
+        self.assertDtype(self.matrix(self.rows), 'f')
+        for dtype in ('f', 'd', 'i', 'q'):
+            m = self.matrix(self.rows, dtype)
+            self.assertDtype(m, dtype)
+            self.assertDtype(self.matrix(m), dtype)
+            self.assertListEqual(list(m), [[1, 2, 3], [4, 5, 6]])
+
+        with self.assertRaises(ValueError):
+            self.matrix(self.rows, 'b')
+        with self.assertRaises(TypeError):
+            self.matrix([[1.5]], 'i')
+
+    def test_precision(self):
+        self.assertEqual(self.matrix([[0.1]], 'd')[0, 0], 0.1)
+        self.assertNotEqual(self.matrix([[0.1]], 'f')[0, 0], 0.1)
+        big = 2 ** 40 + 1
+        self.assertEqual(self.matrix([[big]], 'q')[0, 0], big)
+
+    def test_kept(self):
+        for dtype in ('d', 'i', 'q'):
+            m = self.matrix(self.rows, dtype)
+            for result in (m.copy(), m.T, m[1:, ::2], m[:, 1].copy(),
+                           m + m, m - m, -m, m * 3, 3 * m, m @ m.T,
+                           (m @ m.T) ** 3, (m @ m.T) ** 0):
+                self.assertDtype(result, dtype)
+
+            m *= 2
+            self.assertDtype(m, dtype)
+            m[0] = [7, 8, 9]
+            self.assertDtype(m, dtype)
+            self.assertListEqual(list(m), [[7, 8, 9], [8, 10, 12]])
+            self.assertDtype(Matrix.zeros(2, 2, dtype), dtype)
+            self.assertDtype(Matrix.even(2, dtype), dtype)
+
+    def test_promotion(self):
+        i, q, f, d = (self.matrix(self.rows, dtype) for dtype in 'iqfd')
+        self.assertDtype(i + q, 'q')
+        self.assertDtype(i - f, 'd')
+        self.assertDtype(f + d, 'd')
+        self.assertDtype(i @ f.T, 'd')
+        self.assertDtype(i * 0.5, 'd')
+        self.assertDtype(f * 0.5, 'f')
+        self.assertListEqual(list(i * 0.5), [[0.5, 1, 1.5], [2, 2.5, 3]])
+
+        self.assertDtype((i @ i.T).inv(), 'd')
+        self.assertDtype((f @ f.T).inv(), 'f')
+        self.assertAlmostEqual((i @ i.T).det(), 54)
+
+        with self.assertRaises(TypeError):
+            i *= 0.5
+        with self.assertRaises(TypeError):
+            i += f
+        with self.assertRaises(TypeError):
+            i[0, 0] = 0.5
+
+    def test_overflow(self):
+        for dtype, bits in (('i', 31), ('q', 63)):
+            big = self.matrix([[2 ** bits - 1]], dtype)
+            small = self.matrix([[-2 ** bits]], dtype)
+            half = 2 ** (bits // 2)
+            square = self.matrix([[half] * 3] * 3, dtype)
+            for operation in (lambda: big + big, lambda: small - big,
+                              lambda: big * 2, lambda: -small,
+                              lambda: square @ square, lambda: square ** 3):
+                with self.assertRaises(OverflowError):
+                    operation()
+
+            self.assertEqual((big - big)[0, 0], 0)
+            self.assertEqual((small + big)[0, 0], -1)
+            self.assertEqual((self.matrix([[half]], dtype) ** 2)[0, 0],
+                             half * half)
+
+    def test_astype(self):
+        m = self.matrix([[1.7, -2.7]], 'd')
+        self.assertDtype(m.astype('q'), 'q')
+        self.assertListEqual(list(m.astype('i')), [[1, -2]])
+        self.assertDtype(m.astype('f').astype('d'), 'd')
+
+    def test_str(self):
+        m = self.matrix([[1, -20], [3, 4000]], 'i')
+        self.assertEqual(str(m), "[Matrix 2x2]\n"
+                                 " 1    -20\n"
+                                 " 3  4,000")
+
+    def test_binary_format(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'matrix.bin')
+            for dtype in ('f', 'd', 'i', 'q'):
+                m = self.matrix([[2 ** 30, 2], [3, -4]], dtype)
+                m.save(path)
+                self.assertDtype(Matrix.load(path), dtype)
+                self.assertEqual(Matrix.load(path), m)
+                mapped = Matrix.open_mmap(path)
+                self.assertDtype(mapped, dtype)
+                self.assertEqual(mapped, m)
+                del mapped
+
+
+class TestBinaryFormat(TestCase):
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'matrix.bin')
+        self.m = random_matrix(7, 5, 1)
+        self.m.save(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_format(self):
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        self.assertEqual(len(data), HEADER.size + 4 * 7 * 5)
+        self.assertTupleEqual(HEADER.unpack(data[:HEADER.size]),
+                              (MAGIC, 1, b'f', 7, 5))
+
+    def test_load(self):
+        m = Matrix.load(self.path)
+        self.assertTupleEqual(m.size, (7, 5))
+        self.assertEqual(m, self.m)
+
+        for rows in ((), ([], [])):
+            Matrix(rows).save(self.path)
+            self.assertTupleEqual(Matrix.load(self.path).size,
+                                  Matrix(rows).size)
+
+    def test_save_view(self):
+        self.m[1:5, ::-2].save(self.path)
+        self.assertEqual(Matrix.load(self.path), self.m[1:5, ::-2])
+
+    def test_mmap(self):
+        m = Matrix.open_mmap(self.path)
+        self.assertIsInstance(m.rows, MappedRows)
+        self.assertTupleEqual(m.size, (7, 5))
+        self.assertEqual(m, self.m)
+        self.assertEqual(m[3, -1], self.m[3, -1])
+        self.assertListEqual(list(m[2:6, ::2]), list(self.m[2:6, ::2]))
+        self.assertEqual(repr(m), repr(self.m))
+        self.assertEqual(m @ self.m.T, self.m @ self.m.T)
+
+        with self.assertRaises(TypeError):
+            m[0, 0] = 1
+
+    def test_mmap_writable(self):
+        m = Matrix.open_mmap(self.path, writable=True)
+        m[0, 0] = 100
+        m[1] = [1, 2, 3, 4, 5]
+        m += Matrix.even(7)[:, :5]
+        with self.assertRaises(DimensionError):
+            m[2] = [1, 2]
+
+        loaded = Matrix.load(self.path)
+        self.assertEqual(loaded[0, 0], 101)
+        self.assertListEqual(list(loaded[1]), [[1, 3, 3, 4, 5]])
+        self.assertEqual(loaded[2:], self.m[2:] + Matrix.even(7)[2:, :5])
+
+    def test_errors(self):
+        with open(self.path, 'r+b') as file:
+            file.truncate(HEADER.size + 10)
+        with self.assertRaises(ValueError):
+            Matrix.load(self.path)
+        with self.assertRaises(ValueError):
+            Matrix.open_mmap(self.path)
+
+        with open(self.path, 'wb') as file:
+            file.write(b'text' * 10)
+        with self.assertRaises(ValueError):
+            Matrix.load(self.path)
@@ -0,0 +1,430 @@
+from array import array
+from bisect import bisect_left
+from numbers import Integral, Real
+from operator import add
+
+from .problem_3 import (
+    DimensionError, Matrix, index_range, result_dtype, split_2d_slice,
+)
+
+
+class SparseMatrix:
+    """ Sparse matrix in CSR (compressed sparse row) format.
+
+    Only nonzero items are stored: columns and values of row i are
+    indices[indptr[i]:indptr[i + 1]] and data[indptr[i]:indptr[i + 1]],
+    columns of every row are sorted.
+
+    Operations with dense Matrix are dispatched automatically:
+        sparse + sparse, sparse * number, sparse @ sparse, sparse ** n,
+        sparse.T and slices of sparse are sparse;
+        sparse + dense, sparse @ dense and dense @ sparse are dense.
+
+    Example:
+        >> s = SparseMatrix(3, 3, [(0, 1, 2.0), (2, 2, 1.0)])
+        >> s[0, 1]
+        2.0
+        >> dense = Matrix.even(3) + s  # Matrix
+    """
+    precision = 1  # precision for output
+    dtype = 'f'  # typecode of items (dtype of dense results is promoted)
+
+    def __init__(self, count_rows, count_cols, items=(), precision=1):
+        """ Init function which create matrix from items in COO format.
+
+        Args:
+            count_rows(int): count rows
+            count_cols(int): count cols
+            items(Iterable[Tuple[int, int, float]]): triples (row, col,
+                value), values of equal positions are summed.
+            precision(int): precision for printing.
+
+        Returns:
+            NoneType: return nothing
+
+        """
+        rows = {}
+        for num_row, num_col, value in items:
+            if not (0 <= num_row < count_rows and 0 <= num_col < count_cols):
+                raise IndexError('Index of item is out of matrix')
+            row = rows.setdefault(num_row, {})
+            row[num_col] = row.get(num_col, 0) + value
+
+        self.init_rows(count_rows, count_cols,
+                       (rows.get(num_row) for num_row in range(count_rows)))
+        self.precision = precision
+
+    def init_rows(self, count_rows, count_cols, rows):
+        """ Fill CSR arrays from rows.
+
+        Args:
+            count_rows(int): count rows
+            count_cols(int): count cols
+            rows(Iterable[Dict[int, float]]): for every row dict (or None
+                for empty row) col -> value, zero values are dropped.
+
+        Returns:
+            NoneType: return nothing
+
+        """
+        self.count_rows, self.count_cols = count_rows, count_cols
+        indptr, indices, data = array('q', [0]), array('i'), array('f')
+
+        for row in rows:
+            if row:
+                for num_col in sorted(row):
+                    value = row[num_col]
+                    if value:
+                        indices.append(num_col)
+                        data.append(value)
+            indptr.append(len(indices))
+
+        self.indptr, self.indices, self.data = indptr, indices, data
+
+    @classmethod
+    def from_rows(cls, count_rows, count_cols, rows, precision=1):
+        """ Create matrix from dicts col -> value for every row """
+        matrix = cls.__new__(cls)
+        matrix.init_rows(count_rows, count_cols, rows)
+        matrix.precision = precision
+        return matrix
+
+    @classmethod
+    def from_arrays(cls, size, indptr, indices, data, precision=1):
+        """ Create matrix from CSR arrays (without copying) """
+        matrix = cls.__new__(cls)
+        matrix.count_rows, matrix.count_cols = size
+        matrix.indptr, matrix.indices, matrix.data = indptr, indices, data
+        matrix.precision = precision
+        return matrix
+
+    @classmethod
+    def from_dense(cls, matrix):
+        """ Create sparse matrix from nonzero items of Matrix """
+        rows = (
+            {num_col: value for num_col, value in enumerate(row) if value}
+            for row in matrix.iter_rows()
+        )
+        return cls.from_rows(*matrix.size, rows, matrix.precision)
+
+    def to_dense(self):
+        """ Create Matrix with the same items """
+        return Matrix(self.iter_rows(), self.precision)
+
+    @classmethod
+    def zeros(cls, count_rows, count_cols):
+        return cls(count_rows, count_cols)
+
+    @classmethod
+    def even(cls, count_rows):
+        return cls(count_rows, count_rows,
+                   ((i, i, 1) for i in range(count_rows)))
+
+    def copy(self):
+        return SparseMatrix.from_arrays(
+            self.size, array('q', self.indptr), array('i', self.indices),
+            array('f', self.data), self.precision,
+        )
+
+    @property
+    def size(self):
+        """ Property which return size or matrix """
+        return self.count_rows, self.count_cols
+
+    @property
+    def nnz(self):
+        """ Count of stored (nonzero) items """
+        return len(self.data)
+
+    def row(self, num_row):
+        """ Return columns and values of nonzero items of row """
+        start, stop = self.indptr[num_row], self.indptr[num_row + 1]
+        return self.indices[start:stop], self.data[start:stop]
+
+    def iter_dicts(self):
+        """ Iterate rows as dicts col -> value of nonzero items """
+        for num_row in range(self.count_rows):
+            yield dict(zip(*self.row(num_row)))
+
+    def items(self):
+        """ Iterate nonzero items as triples (row, col, value) """
+        for num_row in range(self.count_rows):
+            for num_col, value in zip(*self.row(num_row)):
+                yield num_row, num_col, value
+
+    def iter_rows(self):
+        """ Iterate rows as dense arrays """
+        for num_row in range(self.count_rows):
+            row = array('f', bytes(4 * self.count_cols))
+            for num_col, value in zip(*self.row(num_row)):
+                row[num_col] = value
+            yield row
+
+    def __iter__(self):
+        return (list(row) for row in self.iter_rows())
+
+    @property
+    def T(self):
+        """ Property for create transpose matrix and return it
+
+        Return:
+            SparseMatrix: transposed matrix
+        """
+        # counting sort of items by column, rows of every column stay sorted
+        counts = [0] * (self.count_cols + 1)
+        for num_col in self.indices:
+            counts[num_col + 1] += 1
+        indptr = array('q', [0]) * (self.count_cols + 1)
+        for num_col in range(self.count_cols):
+            indptr[num_col + 1] = indptr[num_col] + counts[num_col + 1]
+
+        positions = array('q', indptr)
+        indices = array('i', bytes(4 * self.nnz))
+        data = array('f', bytes(4 * self.nnz))
+        for num_row, num_col, value in self.items():
+            position = positions[num_col]
+            indices[position], data[position] = num_row, value
+            positions[num_col] = position + 1
+
+        return SparseMatrix.from_arrays(
+            (self.count_cols, self.count_rows), indptr, indices, data,
+            self.precision,
+        )
+
+    def __str__(self):
+        text = f'[SparseMatrix {self.count_rows}x{self.count_cols}, ' \
+            f'{self.nnz} nonzeros]\n'
+        text += repr(self)
+        return text
+
+    def __repr__(self):
+        return '\n'.join(
+            f'({num_row}, {num_col}) {value: #,.{self.precision}f}'
+            for num_row, num_col, value in self.items()
+        )
+
+    ##################################################
+    # Slicing
+    ##################################################
+
+    def __getitem__(self, item):
+        # get horizontal and vertical slices
+        h_slice, v_slice = split_2d_slice(item)
+
+        if not isinstance(h_slice, (Integral, slice)) or \
+                (v_slice and not isinstance(v_slice, (Integral, slice))):
+            raise TypeError('Slice must be int, slice, or tuple of them')
+
+        # If need return one number
+        if isinstance(h_slice, Integral) and isinstance(v_slice, Integral):
+            return self.cell(h_slice, v_slice)
+
+        rows = index_range(range(self.count_rows), h_slice)
+        cols = index_range(range(self.count_cols), v_slice)
+        if not rows or not cols:
+            return None
+
+        def select(num_row):
+            return {
+                cols.index(num_col): value
+                for num_col, value in zip(*self.row(num_row))
+                if num_col in cols
+            }
+
+        return SparseMatrix.from_rows(len(rows), len(cols), map(select, rows),
+                                      self.precision)
+
+    def cell(self, num_row, num_col):
+        """ Return item of matrix (indexes can be negative) """
+        num_row = range(self.count_rows)[num_row]
+        num_col = range(self.count_cols)[num_col]
+
+        start, stop = self.indptr[num_row], self.indptr[num_row + 1]
+        position = bisect_left(self.indices, num_col, start, stop)
+        if position < stop and self.indices[position] == num_col:
+            return self.data[position]
+        return 0.0
+
+    ##################################################
+    # Add methods
+    ##################################################
+
+    def __add__(self, other):
+        if isinstance(other, SparseMatrix):
+            if self.size != other.size:
+                raise DimensionError
+
+            rows = []
+            for row, other_row in zip(self.iter_dicts(), other.iter_dicts()):
+                for num_col, value in other_row.items():
+                    row[num_col] = row.get(num_col, 0) + value
+                rows.append(row)
+            return SparseMatrix.from_rows(*self.size, rows, self.precision)
+
+        if isinstance(other, Matrix):
+            if self.size != other.size:
+                raise DimensionError
+
+            result = other.astype(result_dtype(other.dtype, self.dtype))
+            for num_row, num_col, value in self.items():
+                result.rows[num_row][num_col] += value
+            return result
+
+        return NotImplemented
+
+    def __radd__(self, other):
+        return self + other
+
+    ##################################################
+    # sing methods
+    ##################################################
+
+    def __neg__(self):
+        """ Return new matrix when: new_item = -old_item """
+        return self * (-1)
+
+    def __pos__(self):
+        return self.copy()
+
+    ##################################################
+    # Sub methods
+    ##################################################
+
+    def __sub__(self, other):
+        if not isinstance(other, (Matrix, SparseMatrix)):
+            return NotImplemented
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    ##################################################
+    # Comparison methods
+    ##################################################
+
+    def __eq__(self, other):
+        """ Compare matrix. Two matrix is equal if equal each item's pair """
+        if isinstance(other, SparseMatrix):
+            return self.size == other.size and self.indptr == other.indptr \
+                and self.indices == other.indices and self.data == other.data
+        # dense matrices are compared by __eq__ of their class
+        return NotImplemented
+
+    ##################################################
+    # Mul methods
+    ##################################################
+
+    def __mul__(self, other):
+        """ Mul matrix on number
+
+        Args:
+            other(Real): number to multiplicate
+
+        Returns:
+            SparseMatrix: return new SparseMatrix
+
+        """
+        if not isinstance(other, Real):
+            return NotImplemented
+
+        if not other:
+            return SparseMatrix(*self.size, precision=self.precision)
+
+        return SparseMatrix.from_arrays(
+            self.size, array('q', self.indptr), array('i', self.indices),
+            array('f', (value * other for value in self.data)),
+            self.precision,
+        )
+
+    def __rmul__(self, other):
+        return self * other
+
+    ##################################################
+    # MatMul
+    ##################################################
+
+    def __matmul__(self, other):
+        """ Mul matrix on matrix by math rules.
+
+        Only nonzero items are multiplied: row i of result is sum of
+        rows k of other, multiplied on self[i, k].
+        """
+        if not isinstance(other, (Matrix, SparseMatrix)):
+            return NotImplemented
+
+        if self.count_cols != other.count_rows:
+            raise DimensionError
+
+        if isinstance(other, SparseMatrix):
+            other_rows = [other.row(num_row) for num_row in range(
+                other.count_rows)]
+            rows = []
+            for num_row in range(self.count_rows):
+                row = {}
+                for num_inner, value in zip(*self.row(num_row)):
+                    for num_col, other_value in zip(*other_rows[num_inner]):
+                        row[num_col] = row.get(num_col, 0) + \
+                            value * other_value
+                rows.append(row)
+            return SparseMatrix.from_rows(
+                self.count_rows, other.count_cols, rows, self.precision,
+            )
+
+        # rows of python numbers (rows of NumpyMatrix contain NumPy ones)
+        other_rows = list(other)
+        rows = []
+        for num_row in range(self.count_rows):
+            row = [0.0] * other.count_cols
+            for num_inner, value in zip(*self.row(num_row)):
+                row = list(map(add, row, map(value.__mul__,
+                                             other_rows[num_inner])))
+            rows.append(row)
+        return Matrix(rows, other.precision,
+                      result_dtype(self.dtype, other.dtype))
+
+    def __rmatmul__(self, other):
+        """ Mul dense matrix on sparse matrix """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+
+        if other.count_cols != self.count_rows:
+            raise DimensionError
+
+        self_rows = [self.row(num_row) for num_row in range(self.count_rows)]
+        rows = []
+        for other_row in other.iter_rows():
+            row = [0.0] * self.count_cols
+            for num_inner, value in enumerate(other_row):
+                if value:
+                    for num_col, self_value in zip(*self_rows[num_inner]):
+                        row[num_col] += value * self_value
+            rows.append(row)
+        return Matrix(rows, other.precision,
+                      result_dtype(self.dtype, other.dtype))
+
+    ##################################################
+    # Pow methods
+    ##################################################
+
+    def __pow__(self, other):
+        """ Mul matrix on itself other times """
+        if not isinstance(other, Integral):
+            raise TypeError
+
+        if other < 0:
+            raise ValueError("Power can't be negative.")
+
+        if self.count_rows != self.count_cols:
+            raise DimensionError
+
+        # exponentiation by squaring, like in Matrix
+        result = SparseMatrix.even(self.count_rows)
+        square = self
+        while other:
+            if other & 1:
+                result = result @ square
+            other >>= 1
+            if other:
+                square = square @ square
+        result.precision = self.precision
+        return result
@@ -0,0 +1,173 @@
+from random import Random
+from unittest import TestCase, skipIf
+
+from .problem_3 import DimensionError, Matrix
+from .sparse import SparseMatrix
+
+try:
+    from .numpy_matrix import NumpyMatrix
+except ImportError:  # numpy is not installed
+    NumpyMatrix = None
+
+
+def random_sparse(count_rows, count_cols, count_items, seed=0):
+    random = Random(seed)
+    return SparseMatrix(count_rows, count_cols, (
+        (random.randrange(count_rows), random.randrange(count_cols),
+         random.randint(-20, 20) / 4)
+        for _ in range(count_items)
+    ))
+
+
+class TestSparseMatrix(TestCase):
+
+    def setUp(self):
+        self.s1 = random_sparse(20, 30, 60, seed=1)
+        self.s2 = random_sparse(20, 30, 60, seed=2)
+        self.s3 = random_sparse(30, 10, 40, seed=3)
+        self.d1, self.d2, self.d3 = (
+            s.to_dense() for s in (self.s1, self.s2, self.s3)
+        )
+
+    def assertMatrixEqual(self, m1, m2):
+        self.assertTupleEqual(m1.size, m2.size)
+        self.assertListEqual(list(m1), list(m2))
+
+    def test_init(self):
+        s = SparseMatrix(2, 3, [(0, 1, 2), (1, 2, 3), (0, 1, 1), (1, 0, 0)])
+        self.assertTupleEqual(s.size, (2, 3))
+        self.assertEqual(s.nnz, 2)
+        self.assertListEqual(list(s), [[0, 3, 0], [0, 0, 3]])
+        self.assertListEqual(list(s.items()), [(0, 1, 3.0), (1, 2, 3.0)])
+
+        with self.assertRaises(IndexError):
+            SparseMatrix(2, 3, [(2, 0, 1)])
+
+    def test_dense(self):
+        self.assertEqual(SparseMatrix.from_dense(self.d1), self.s1)
+        self.assertEqual(self.s1, self.d1)
+        self.assertEqual(self.d1, self.s1)
+        self.assertNotEqual(self.s1, self.s2)
+        self.assertIsInstance(self.s1.to_dense(), Matrix)
+
+    def test_zeros_even(self):
+        self.assertEqual(SparseMatrix.zeros(3, 4), Matrix.zeros(3, 4))
+        self.assertEqual(SparseMatrix.even(4), Matrix.even(4))
+        self.assertEqual(SparseMatrix.zeros(3, 4).nnz, 0)
+
+    def test_getitem(self):
+        for num_row in range(self.d1.count_rows):
+            for num_col in range(self.d1.count_cols):
+                self.assertEqual(self.s1[num_row, num_col],
+                                 self.d1[num_row, num_col])
+        self.assertEqual(self.s1[-1, -1], self.d1[-1, -1])
+
+        for item in ((slice(2, 10), slice(5, None, 3)),
+                     (slice(None, None, -2), slice(20, 2, -1)),
+                     3, (slice(4, 5), 7)):
+            self.assertIsInstance(self.s1[item], SparseMatrix)
+            self.assertMatrixEqual(self.s1[item], self.d1[item])
+
+        self.assertIsNone(self.s1[5:5])
+        with self.assertRaises(IndexError):
+            self.s1[20, 0]
+        with self.assertRaises(TypeError):
+            self.s1['test']
+
+    def test_transpose(self):
+        self.assertIsInstance(self.s1.T, SparseMatrix)
+        self.assertMatrixEqual(self.s1.T, self.d1.T)
+        self.assertEqual(self.s1.T.T, self.s1)
+
+    def test_add_sub(self):
+        self.assertIsInstance(self.s1 + self.s2, SparseMatrix)
+        self.assertMatrixEqual(self.s1 + self.s2, self.d1 + self.d2)
+        self.assertMatrixEqual(self.s1 - self.s2, self.d1 - self.d2)
+        self.assertEqual((self.s1 - self.s1).nnz, 0)
+
+        for result in (self.s1 + self.d2, self.d2 + self.s1,
+                       self.s1 - self.d2, self.d2 - self.s1):
+            self.assertIsInstance(result, Matrix)
+        self.assertMatrixEqual(self.s1 + self.d2, self.d1 + self.d2)
+        self.assertMatrixEqual(self.d2 + self.s1, self.d1 + self.d2)
+        self.assertMatrixEqual(self.s1 - self.d2, self.d1 - self.d2)
+        self.assertMatrixEqual(self.d2 - self.s1, self.d2 - self.d1)
+
+        d2 = self.d2
+        d2 += self.s1
+        self.assertMatrixEqual(d2, self.d1 + self.d2)
+
+        with self.assertRaises(DimensionError):
+            self.s1 + self.s3
+        with self.assertRaises(DimensionError):
+            self.s1 + self.d3
+        with self.assertRaises(TypeError):
+            self.s1 + 1
+
+    @skipIf(NumpyMatrix is None, 'numpy is not installed')
+    def test_numpy(self):
+        n1, n2, n3 = map(NumpyMatrix, (self.d1, self.d2, self.d3))
+        self.assertEqual(self.s1, n1)
+        self.assertEqual(n1, self.s1)
+        self.assertNotEqual(self.s1, n2)
+        self.assertMatrixEqual(n2 + self.s1, self.d1 + self.d2)
+        self.assertMatrixEqual(self.s1 - n2, self.d1 - self.d2)
+        self.assertMatrixEqual(n1 @ self.s3, self.d1 @ self.d3)
+        self.assertMatrixEqual(self.s1 @ n3, self.d1 @ self.d3)
+
+        n = NumpyMatrix(self.d2)
+        n += self.s1
+        self.assertMatrixEqual(n, self.d1 + self.d2)
+        n -= self.s1
+        self.assertMatrixEqual(n, self.d2)
+        n @= self.s3
+        self.assertMatrixEqual(n, self.d2 @ self.d3)
+
+        with self.assertRaises(DimensionError):
+            n1 += self.s3
+        with self.assertRaises(TypeError):
+            n1 += 1
+
+    def test_mul(self):
+        self.assertIsInstance(self.s1 * 2, SparseMatrix)
+        self.assertMatrixEqual(self.s1 * 2, self.d1 * 2)
+        self.assertMatrixEqual(-0.5 * self.s1, self.d1 * -0.5)
+        self.assertMatrixEqual(-self.s1, -self.d1)
+        self.assertEqual((self.s1 * 0).nnz, 0)
+
+        with self.assertRaises(TypeError):
+            self.s1 * self.s2
+
+    def test_matmul(self):
+        expected = self.d1 @ self.d3
+        self.assertIsInstance(self.s1 @ self.s3, SparseMatrix)
+        self.assertMatrixEqual(self.s1 @ self.s3, expected)
+        self.assertIsInstance(self.s1 @ self.d3, Matrix)
+        self.assertMatrixEqual(self.s1 @ self.d3, expected)
+        self.assertIsInstance(self.d1 @ self.s3, Matrix)
+        self.assertMatrixEqual(self.d1 @ self.s3, expected)
+
+        with self.assertRaises(DimensionError):
+            self.s1 @ self.s2
+        with self.assertRaises(DimensionError):
+            self.d1 @ self.s2
+        with self.assertRaises(TypeError):
+            self.s1 @ 'test'
+
+    def test_pow(self):
+        s = random_sparse(15, 15, 30, seed=4) * 0.5
+        d = s.to_dense()
+        for power in range(5):
+            self.assertIsInstance(s ** power, SparseMatrix)
+            self.assertMatrixEqual(s ** power, d ** power)
+
+        with self.assertRaises(DimensionError):
+            self.s1 ** 2
+        with self.assertRaises(ValueError):
+            s ** -1
+        with self.assertRaises(TypeError):
+            s ** 0.5
+
+    def test_str(self):
+        s = SparseMatrix(2, 2, [(1, 0, 1.5)])
+        self.assertEqual(str(s), '[SparseMatrix 2x2, 1 nonzeros]\n(1, 0)  1.5')